@@ -1,22 +1,66 @@
+from typing import Any, List, Sequence, Tuple
+
+
 class BatchValidationError(Exception):
     tab = "    "
 
-    def __init__(self, message, errors):
+    def __init__(self, message: str, errors: Sequence[Any], truncated: bool = False):
         count = 0
-        lines = [message]
         for error in errors:
+            if isinstance(error, tuple):
+                error = error[1]
             if isinstance(error, BatchValidationError):
                 count += error.count
-                for line in error.lines:
-                    if not line.strip().startswith("-"):
-                        line = f"- {line}"
-                    lines.append(f"{self.tab}{line}")
+                truncated = truncated or error.truncated
             else:
-                lines.append(f"{self.tab}- {error}")
                 count += 1
-        self.message = "\n".join(lines)
-        self.lines = lines
+        self.header = message
+        self.errors = errors
         self.count = count
-        super(BatchValidationError, self).__init__(
-            f"failed to validate batch ({self.count} errors):\n{self.message}"
-        )
+        self.truncated = truncated
+        self._lines = None
+        super(BatchValidationError, self).__init__(message, errors)
+
+    @property
+    def lines(self) -> List[str]:
+        if self._lines is not None:
+            return self._lines
+        lines = [self.header]
+        stack = [(iter(self.errors), self.tab)]
+        while stack:
+            errors, indent = stack[-1]
+            for error in errors:
+                label = ""
+                if isinstance(error, tuple):
+                    path, error = error
+                    label = f"[{path}]: " if isinstance(path, int) else f"{path}: "
+                if isinstance(error, BatchValidationError):
+                    lines.append(f"{indent}- {label}{error.header}")
+                    stack.append((iter(error.errors), indent + self.tab))
+                    break
+                lines.append(f"{indent}- {label}{error}")
+            else:
+                stack.pop()
+        if self.truncated:
+            lines.append(f"{self.tab}- validation stopped after {self.count} errors")
+        self._lines = lines
+        return lines
+
+    @property
+    def message(self) -> str:
+        return "\n".join(self.lines)
+
+    def flatten(self, path: Tuple = ()) -> List[Tuple[Tuple, str]]:
+        flat = []
+        for error in self.errors:
+            key = path
+            if isinstance(error, tuple):
+                key, error = path + (error[0],), error[1]
+            if isinstance(error, BatchValidationError):
+                flat.extend(error.flatten(key))
+            else:
+                flat.append((key, str(error)))
+        return flat
+
+    def __str__(self) -> str:
+        return f"failed to validate batch ({self.count} errors):\n{self.message}"
@@ -1,6 +1,11 @@
 from .base import SchemaAttribute, SchemaRule
+from .cache import LRU, CacheInfo
+from .compiler import CompiledSchema, compile
 from .config import ConfigObject
+from .context import fail_fast
 from .error import BatchValidationError, PropertyValidationError, RequestValidationError
+from .limits import Limits
+from .parallel import parallel_load
 from .rules import AnyOf
 from .types import (
     Array,
@@ -13,12 +18,15 @@ from .types import (
     Float,
     Inline,
     Int,
+    Map,
     Model,
     Nested,
     Number,
+    OneOf,
     Password,
     Property,
     Regex,
+    Set,
     String,
     Uuid,
 )
@@ -0,0 +1,155 @@
+import collections
+import copy
+import threading
+from typing import Any, Hashable, Iterator
+
+from . import base, record
+
+CacheInfo = collections.namedtuple(
+    "CacheInfo", ("hits", "misses", "evictions", "size", "maxsize")
+)
+
+_SCALARS = frozenset((str, int, float, bool, type(None)))
+_MISSING = object()
+
+
+class _Unhashable(Exception):
+    pass
+
+
+def _key(value: Any) -> Hashable:
+    typ = type(value)
+    if typ in _SCALARS:
+        return typ, value
+    if isinstance(value, dict):
+        try:
+            items = sorted(value.items())
+        except TypeError:
+            raise _Unhashable
+        return dict, tuple((_key(k), _key(v)) for k, v in items)
+    if typ is list or typ is tuple:
+        return list, tuple(_key(v) for v in value)
+    raise _Unhashable
+
+
+def _copy(value: Any) -> Any:
+    typ = type(value)
+    if typ in _SCALARS:
+        return value
+    if typ is dict:
+        return {k: _copy(v) for k, v in value.items()}
+    if typ is list:
+        return [_copy(v) for v in value]
+    if typ is tuple:
+        return tuple(_copy(v) for v in value)
+    if typ is set:
+        return set(value)
+    if isinstance(value, record.Record):
+        return typ(*(_copy(getattr(value, f)) for f in value._fields))
+    if isinstance(value, tuple) and hasattr(value, "_fields"):
+        return typ(*(_copy(v) for v in value))
+    return copy.copy(value)
+
+
+def _children(prop: Any) -> Iterator[Any]:
+    attributes = getattr(prop, "__dict__", {})
+    for name in ("prop", "keys", "values", "schema"):
+        child = attributes.get(name)
+        if isinstance(child, base.SchemaAttribute):
+            yield child
+    for name in ("props", "variants"):
+        children = attributes.get(name)
+        if isinstance(children, dict):
+            yield from children.values()
+    yield from attributes.get("rules", ())
+
+
+def is_cacheable(prop: Any, seen: set = None) -> bool:
+    seen = set() if seen is None else seen
+    if id(prop) in seen:
+        return True
+    seen.add(id(prop))
+    if callable(getattr(prop, "default", None)) or getattr(prop, "lazy", False):
+        return False
+    if getattr(getattr(prop, "range", None), "dynamic", False):
+        return False
+    return all(is_cacheable(child, seen) for child in _children(prop))
+
+
+class LRU:
+    def __init__(self, maxsize: int = 128):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.entries = collections.OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Any:
+        with self.lock:
+            value = self.entries.get(key, _MISSING)
+            if value is _MISSING:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.entries.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(
+            self.hits, self.misses, self.evictions, len(self.entries), self.maxsize
+        )
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __getstate__(self):
+        return {"maxsize": self.maxsize}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+
+class Memoized:
+    __slots__ = ("prop", "cache", "enabled", "token")
+
+    def __init__(self, prop: base.SchemaAttribute, cache: LRU):
+        self.prop = prop
+        self.cache = cache
+        self.enabled = None
+        self.token = object()
+
+    def __call__(self, value: Any) -> Any:
+        prop = self.prop
+        if self.enabled is None:
+            self.enabled = is_cacheable(prop)
+        if self.enabled:
+            try:
+                key = (self.token, _key(value))
+            except _Unhashable:
+                pass
+            else:
+                validated = self.cache.get(key)
+                if validated is _MISSING:
+                    validated = type(prop).load(prop, value)
+                    self.cache.put(key, validated)
+                return _copy(validated)
+        return type(prop).load(prop, value)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, Memoized) and other.cache is self.cache
+
+    def __hash__(self) -> int:
+        return id(self.cache)
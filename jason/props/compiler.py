@@ -0,0 +1,408 @@
+import builtins
+import contextlib
+import datetime
+import functools
+import itertools
+import json
+from typing import Any, Callable, List, Optional, Tuple, Type, Union
+
+from . import base, context, error, utils
+from .types import (
+    Array,
+    Bool,
+    Choice,
+    Compound,
+    Date,
+    Datetime,
+    Email,
+    Float,
+    Inline,
+    Int,
+    Model,
+    Nested,
+    Number,
+    OneOf,
+    Property,
+    Regex,
+    String,
+    Uuid,
+)
+
+NESTED_TYPES = (Nested, Inline, Compound)
+
+
+class CompiledSchema(base.SchemaAttribute):
+    def __init__(self, schema: base.SchemaAttribute, load: Callable, source: str):
+        self.schema = schema
+        self.source = source
+        self.load = load
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return self.load(json.loads(data))
+
+
+class _Block:
+    def __init__(self):
+        self.lines = []
+        self.depth = 0
+
+    def line(self, text: str):
+        self.lines.append(f"{'    ' * self.depth}{text}")
+
+    @contextlib.contextmanager
+    def indent(self):
+        self.depth += 1
+        yield
+        self.depth -= 1
+
+
+class _Compiler:
+    def __init__(self):
+        self.counter = itertools.count()
+        self.namespace = {
+            "PropertyValidationError": error.PropertyValidationError,
+            "BatchValidationError": error.BatchValidationError,
+            "context": context,
+        }
+        self.functions = {}
+        self.blocks = []
+        self.tables = []
+
+    def name(self, prefix: str) -> str:
+        return f"_{prefix}{next(self.counter)}"
+
+    def const(self, value: Any, prefix: str = "c") -> str:
+        name = self.name(prefix)
+        self.namespace[name] = value
+        return name
+
+    def function(self, prop: Any) -> str:
+        if id(prop) in self.functions:
+            return self.functions[id(prop)]
+        name = self.name("f")
+        self.functions[id(prop)] = name
+        if utils.is_plain(prop, NESTED_TYPES):
+            body = functools.partial(self.emit_nested, prop=prop)
+        elif utils.is_plain(prop, (Array,)):
+            body = functools.partial(self.emit_array, prop=prop)
+        elif utils.is_plain(prop, (OneOf,)):
+            body = functools.partial(self.emit_one_of, prop=prop)
+        else:
+            body = functools.partial(self.emit_leaf, prop=prop)
+        max_errors = getattr(prop, "max_errors", None)
+        if max_errors and body.func != self.emit_leaf:
+            inner = self.define(self.name("f"), body)
+            body = functools.partial(self.emit_fail_fast, limit=max_errors, inner=inner)
+        return self.define(name, body)
+
+    def define(self, name: str, body: Callable[["_Block"], None]) -> str:
+        block = _Block()
+        block.line(f"def {name}(value):")
+        with block.indent():
+            body(block)
+        self.blocks.append(block)
+        return name
+
+    def emit_leaf(self, block: _Block, prop: Any):
+        self.emit(block, prop, "value", "out")
+        block.line("return out")
+
+    def emit_fail_fast(self, block: _Block, limit: int, inner: str):
+        block.line(f"with context.fail_fast({limit!r}):")
+        with block.indent():
+            block.line(f"return {inner}(value)")
+
+    def emit_limit(self, block: _Block, header: str):
+        block.line("if max_errors:")
+        with block.indent():
+            block.line('count += getattr(ex, "count", 1)')
+            block.line("if count >= max_errors:")
+            with block.indent():
+                block.line(
+                    f"raise BatchValidationError({header!r}, errors, truncated=True)"
+                )
+
+    def emit_prelude(self, block: _Block, prop: Property, value: str, on_null: str):
+        if prop.default is not None:
+            default = self.const(prop.default)
+            block.line(f"if {value} is None:")
+            with block.indent():
+                call = "()" if callable(prop.default) else ""
+                block.line(f"{value} = {default}{call}")
+        block.line(f"if {value} is None:")
+        with block.indent():
+            if prop.nullable:
+                block.line(on_null)
+            else:
+                block.line('raise PropertyValidationError("Property is not nullable")')
+
+    def emit_range(self, rng: Any, value: str) -> (List[str], bool):
+        if rng.dynamic:
+            return [], True
+        checks = []
+        for bound, op in zip(rng.bounds(), ("<", ">")):
+            if bound is not None:
+                checks.append(f"{value} {op} {self.const(bound)}")
+        return checks, False
+
+    def emit(self, block: _Block, prop: Any, src: str, dst: str):
+        if utils.is_plain(prop, NESTED_TYPES + (Array,)):
+            block.line(f"{dst} = {self.function(prop)}({src})")
+            return
+        inline = self.inliners.get(type(prop))
+        validators = self.validators(prop)
+        if inline is None or validators is None:
+            block.line(f"{dst} = {self.const(prop.load, 'l')}({src})")
+            return
+        value = self.name("v")
+        block.line(f"{value} = {src}")
+        self.emit_prelude(block, prop, value, f"{dst} = None")
+        block.line("else:")
+        with block.indent():
+            condition, body, out = inline(self, prop, value)
+            if condition == "True":
+                block.line(f"{dst} = {out}")
+                self.emit_validators(block, validators, dst)
+                return
+            block.line(f"if {condition}:")
+            with block.indent():
+                for line in body:
+                    block.line(line)
+                block.line(f"{dst} = {out}")
+                self.emit_validators(block, validators, dst)
+            block.line("else:")
+            with block.indent():
+                block.line(f"{dst} = {self.const(prop, 'p')}.load({src})")
+
+    @staticmethod
+    def validators(prop: Any) -> Optional[Tuple[Callable[[Any], Any], ...]]:
+        attributes = getattr(prop, "__dict__", {})
+        if "load" in attributes:
+            return None
+        validate = attributes.get("_validate")
+        if validate is None:
+            return ()
+        if getattr(validate, "__func__", None) is Property._validate_pipeline:
+            return prop.validators
+        return None
+
+    def emit_validators(self, block: _Block, validators: Tuple, dst: str):
+        for validator in validators:
+            block.line(f"{dst} = {self.const(validator, 'l')}({dst})")
+
+    def inline_property(self, prop: Property, value: str) -> (str, List[str], str):
+        if not prop.types:
+            return "True", [], value
+        types = frozenset(t for t in prop.types if t is not bool or bool in prop.types)
+        return f"type({value}) in {self.const(types)}", [], value
+
+    def inline_bool(self, prop: Bool, value: str) -> (str, List[str], str):
+        return f"{value} is True or {value} is False", [], value
+
+    def inline_number(self, prop: Number, value: str) -> (str, List[str], str):
+        types = [t.__name__ for t in (int, float) if t in prop.types]
+        condition = " or ".join(f"type({value}) is {t}" for t in types) or "False"
+        checks, dynamic = self.emit_range(prop.range, value)
+        body = []
+        if dynamic:
+            body.append(f"{self.const(prop.range, 'r')}.validate({value})")
+        elif checks:
+            condition = f"({condition}) and not ({' or '.join(checks)})"
+        out = f"float({value})" if type(prop) is Float else value
+        return condition, body, out
+
+    def inline_string(self, prop: String, value: str) -> (str, List[str], str):
+        condition = f"type({value}) is str"
+        checks, dynamic = self.emit_range(prop.range, f"len({value})")
+        body = []
+        if dynamic:
+            body.append(f"{self.const(prop.range, 'r')}.validate({value})")
+        elif checks:
+            condition = f"{condition} and not ({' or '.join(checks)})"
+        return condition, body, value
+
+    def inline_time(
+        self, prop: Union[Date, Datetime], value: str
+    ) -> (str, List[str], str):
+        typ = datetime.datetime if type(prop) is Datetime else datetime.date
+        condition = f"type({value}) is str or type({value}) is {self.const(typ)}"
+        body = [
+            f"if type({value}) is str:",
+            f"    {value} = {self.const(prop._from_string, 'l')}({value})",
+        ]
+        if typ is datetime.datetime:
+            body.append(f"if {value}.tzinfo is None:")
+            body.append(
+                f"    {value} = {value}.replace(tzinfo={self.const(datetime.timezone.utc)})"
+            )
+        checks, dynamic = self.emit_range(prop.range, value)
+        if dynamic:
+            body.append(f"{self.const(prop.range, 'r')}.validate({value})")
+        elif checks:
+            body.append(f"if {' or '.join(checks)}:")
+            body.append(f"    {self.const(prop.range, 'r')}.raise_error({value})")
+        return condition, body, value
+
+    def inline_format(
+        self, prop: Union[Regex, Uuid], value: str
+    ) -> (str, List[str], str):
+        condition, body, out = self.inline_string(prop, value)
+        match = prop.canonical if type(prop) is Uuid else prop.match
+        condition = f"{condition} and {self.const(match, 'l')}({value}) is not None"
+        return condition, body, out
+
+    def inline_choice(self, prop: Choice, value: str) -> (str, List[str], str):
+        if prop.index is None:
+            return "False", [], value
+        if not prop.size:
+            return "True", [], value
+        scalars = self.const(frozenset((str, int, float, bool)))
+        condition = (
+            f"type({value}) in {scalars} and {value} in {self.const(prop.index)}"
+        )
+        return condition, [], value
+
+    inliners = {
+        Property: inline_property,
+        Bool: inline_bool,
+        Number: inline_number,
+        Int: inline_number,
+        Float: inline_number,
+        String: inline_string,
+        Choice: inline_choice,
+        Date: inline_time,
+        Email: inline_format,
+        Regex: inline_format,
+        Uuid: inline_format,
+        Datetime: inline_time,
+    }
+
+    def emit_nested(self, block: _Block, prop: Nested):
+        self.emit_prelude(block, prop, "value", "return None")
+        block.line("if not isinstance(value, dict):")
+        with block.indent():
+            block.line(f"return {self.const(prop, 'p')}.load(value)")
+        block.line("validated = {}")
+        block.line("errors = []")
+        block.line("max_errors = context.max_errors()")
+        block.line("count = 0")
+        for field, field_prop in prop.props.items():
+            out = self.name("o")
+            block.line(f"{out} = value.get({field!r}, None)")
+            block.line("try:")
+            with block.indent():
+                self.emit(block, field_prop, out, out)
+            block.line("except (PropertyValidationError, BatchValidationError) as ex:")
+            with block.indent():
+                block.line(f"errors.append(({field!r}, ex))")
+                self.emit_limit(block, "failed to validate object")
+            block.line("else:")
+            with block.indent():
+                block.line(f"validated[{field!r}] = {out}")
+        if prop.strict:
+            block.line(
+                f"extras = [k for k in value if k not in {self.const(prop.props)}]"
+            )
+            block.line("if extras:")
+            with block.indent():
+                block.line(
+                    'errors.append(f"Strict mode is True and supplied object contains extra keys: '
+                    "'{', '.join(extras)}'\")"
+                )
+        block.line("if errors:")
+        with block.indent():
+            block.line(
+                'raise BatchValidationError("failed to validate object", errors)'
+            )
+        if prop.record is not None:
+            block.line(f"return {self.const(prop.record)}(*validated.values())")
+        else:
+            block.line("return validated")
+
+    def emit_one_of(self, block: _Block, prop: OneOf):
+        self.emit_prelude(block, prop, "value", "return None")
+        block.line("if not isinstance(value, dict):")
+        with block.indent():
+            block.line(f"return {self.const(prop, 'p')}.load(value)")
+        table = {}
+        functions = {tag: self.function(v) for tag, v in prop.variants.items()}
+        self.tables.append((table, functions))
+        block.line("try:")
+        with block.indent():
+            block.line(
+                f"variant = {self.const(table, 't')}[value.get({prop.discriminator!r})]"
+            )
+        block.line("except (KeyError, TypeError):")
+        with block.indent():
+            block.line(f"return {self.const(prop, 'p')}.load(value)")
+        block.line("return variant(value)")
+
+    def emit_array(self, block: _Block, prop: Array):
+        self.emit_prelude(block, prop, "value", "return None")
+        block.line("if not isinstance(value, (list, tuple)):")
+        with block.indent():
+            block.line(f"return {self.const(prop, 'p')}.load(value)")
+        if prop.range.dynamic or prop.range.bounds() != (None, None):
+            block.line(f"{self.const(prop.range, 'r')}.validate(value)")
+        if prop.batch_types:
+            block.line(f"validated = {self.const(prop._validate_batch, 'l')}(value)")
+            block.line("if validated is not None:")
+            with block.indent():
+                if prop.unique:
+                    block.line(f"{self.const(prop._check_unique, 'l')}(value)")
+                block.line("return validated")
+        block.line("errors = []")
+        block.line("validated = []")
+        block.line("max_errors = context.max_errors()")
+        block.line("count = 0")
+        block.line("for index, item in enumerate(value):")
+        with block.indent():
+            block.line("try:")
+            with block.indent():
+                self.emit(block, prop.prop, "item", "item")
+            block.line("except (PropertyValidationError, BatchValidationError) as ex:")
+            with block.indent():
+                block.line("errors.append((index, ex))")
+                self.emit_limit(block, "failed to validate array")
+                block.line("continue")
+            block.line("validated.append(item)")
+        block.line("if errors:")
+        with block.indent():
+            block.line('raise BatchValidationError("failed to validate array", errors)')
+        if prop.unique:
+            block.line(f"{self.const(prop._check_unique, 'l')}(validated)")
+        if prop.output != "list":
+            block.line(f"return {self.const(prop._convert, 'l')}(validated)")
+        else:
+            block.line("return validated")
+
+    def build(self, schema: Any) -> (Callable, str):
+        name = self.function(schema)
+        source = "\n\n".join("\n".join(block.lines) for block in reversed(self.blocks))
+        code = builtins.compile(source, f"<jason.props.compile:{name}>", "exec")
+        exec(code, self.namespace)
+        for table, functions in self.tables:
+            table.update((tag, self.namespace[f]) for tag, f in functions.items())
+        return _scoped(self.namespace[name]), source
+
+
+def _scoped(function: Callable) -> Callable:
+    @functools.wraps(function)
+    def load(value: Any) -> Any:
+        if context.bounds() is not None:
+            return function(value)
+        with context.load_scope():
+            return function(value)
+
+    return load
+
+
+def compile(
+    schema: Union[Type[Model], Model, base.SchemaAttribute, Type[base.SchemaAttribute]]
+) -> CompiledSchema:
+    if utils.is_instance_or_type(schema, Model) and not isinstance(schema, Property):
+        schema = Nested(schema)
+    elif utils.is_type(schema):
+        schema = schema()
+    load, source = _Compiler().build(schema)
+    return CompiledSchema(schema, load, source)
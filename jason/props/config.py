@@ -1,7 +1,7 @@
 import os
 from typing import Any
 
-from jason.props import error, types
+from jason.props import context, error, types
 
 
 class ConfigObject(types.Model):
@@ -10,16 +10,21 @@ class ConfigObject(types.Model):
         instance = cls()
         errors = []
         fields = {name.lower(): value for name, value in fields.items()}
-        for name, prop in cls.__props__.items():
-            value = fields.get(name.lower(), None)
-            if value is None:
-                value = os.environ.get(name.upper(), None)
-            try:
-                value = prop.load(value)
-            except error.PropertyValidationError as ex:
-                errors.append(f"could not load property '{name}': {ex}")
-                continue
-            setattr(instance, name, value)
+        with context.fail_fast(cls.__max_errors__) as max_errors:
+            for name, prop in cls.__props__.items():
+                value = fields.get(name.lower(), None)
+                if value is None:
+                    value = os.environ.get(name.upper(), None)
+                try:
+                    value = prop.load(value)
+                except error.PropertyValidationError as ex:
+                    errors.append((name, ex))
+                    if max_errors and len(errors) >= max_errors:
+                        raise error.BatchValidationError(
+                            "Failed to load config", errors, truncated=True
+                        )
+                    continue
+                setattr(instance, name, value)
         if len(errors):
             raise error.BatchValidationError("Failed to load config", errors)
         return instance
@@ -0,0 +1,43 @@
+import contextlib
+import contextvars
+from typing import Any, Dict, Iterator, Optional
+
+_max_errors = contextvars.ContextVar("max_errors", default=None)
+_bounds = contextvars.ContextVar("bounds", default=None)
+
+
+def max_errors() -> Optional[int]:
+    return _max_errors.get()
+
+
+@contextlib.contextmanager
+def fail_fast(max_errors: Optional[int] = 1) -> Iterator[Optional[int]]:
+    current = _max_errors.get()
+    if max_errors is None:
+        yield current
+        return
+    if current is not None:
+        max_errors = min(current, max_errors)
+    token = _max_errors.set(max_errors)
+    try:
+        yield max_errors
+    finally:
+        _max_errors.reset(token)
+
+
+def bounds() -> Optional[Dict[Any, Any]]:
+    return _bounds.get()
+
+
+@contextlib.contextmanager
+def load_scope() -> Iterator[Dict[Any, Any]]:
+    scope = _bounds.get()
+    if scope is not None:
+        yield scope
+        return
+    scope = {}
+    token = _bounds.set(scope)
+    try:
+        yield scope
+    finally:
+        _bounds.reset(token)
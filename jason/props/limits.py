@@ -0,0 +1,178 @@
+from typing import Any, Optional, Tuple
+
+from . import compiler, error, utils
+from .rules import AnyOf
+from .types import (
+    Array,
+    Bool,
+    Choice,
+    Date,
+    Datetime,
+    Map,
+    Model,
+    Nested,
+    Number,
+    OneOf,
+    Property,
+    String,
+)
+
+SCALAR_LENGTH = 256
+SCALAR_TYPES = (int, float, bool, type(None))
+
+_Bounds = Tuple[Optional[int], Optional[int], Optional[int], Optional[int]]
+_UNBOUNDED = (None, None, None, None)
+_SCALAR = (0, 1, 0, 0)
+
+
+def _static(bound: Any) -> Optional[int]:
+    return None if bound is None or callable(bound) else bound
+
+
+def _add(a: Optional[int], b: Optional[int]) -> Optional[int]:
+    return None if a is None or b is None else a + b
+
+
+def _times(a: Optional[int], b: Optional[int]) -> Optional[int]:
+    return None if a is None or b is None else a * b
+
+
+def _max(*values: Optional[int]) -> Optional[int]:
+    return None if None in values else max(values, default=0)
+
+
+def _union(*bounds: _Bounds) -> _Bounds:
+    return tuple(_max(*values) for values in zip(*bounds))
+
+
+def _choice_length(prop: Choice) -> Optional[int]:
+    if prop.lazy or not prop.size or prop.unhashable:
+        return None
+    if not all(type(c) is str or type(c) in SCALAR_TYPES for c in prop.index):
+        return None
+    return max((len(c) for c in prop.index if type(c) is str), default=0)
+
+
+def _derive(prop: Any) -> _Bounds:
+    if isinstance(prop, compiler.CompiledSchema):
+        prop = prop.schema
+    if utils.is_instance_or_type(prop, Model) and not isinstance(prop, Property):
+        prop = Nested(prop)
+    elif utils.is_type(prop):
+        prop = prop()
+    if isinstance(prop, Nested):
+        if not prop.strict:
+            return _UNBOUNDED
+        fields = [_derive(field) for field in prop.props.values()]
+        names = max((len(name) for name in prop.props), default=0)
+        depth, _, length, size = _union(*fields, (0, 0, names, 0))
+        nodes = 1
+        for field in fields:
+            nodes = _add(nodes, field[1])
+        return _add(depth, 1), nodes, length, size
+    if isinstance(prop, Array):
+        count = _static(prop.range.max_value)
+        depth, nodes, length, size = _derive(prop.prop)
+        return _add(depth, 1), _add(_times(count, nodes), 1), length, _max(size, count)
+    if isinstance(prop, Map):
+        count = _static(prop.range.max_value)
+        _, _, key_length, _ = _derive(prop.keys)
+        depth, nodes, length, size = _derive(prop.values)
+        return (
+            _add(depth, 1),
+            _add(_times(count, nodes), 1),
+            _max(length, key_length),
+            size,
+        )
+    if isinstance(prop, OneOf):
+        return _union(*(_derive(variant) for variant in prop.variants.values()))
+    if isinstance(prop, AnyOf):
+        return _union(*(_derive(rule) for rule in prop.rules))
+    if isinstance(prop, String):
+        return 0, 1, _static(prop.range.max_value), 0
+    if isinstance(prop, Choice):
+        length = _choice_length(prop)
+        return _UNBOUNDED if length is None else (0, 1, length, 0)
+    if isinstance(prop, (Number, Bool, Date, Datetime)):
+        return 0, 1, SCALAR_LENGTH if prop.allow_strings else 0, 0
+    if type(prop) is Property and prop.types and set(prop.types) <= set(SCALAR_TYPES):
+        return _SCALAR
+    return _UNBOUNDED
+
+
+class Limits:
+    def __init__(
+        self,
+        max_depth: int = None,
+        max_nodes: int = None,
+        max_string_length: int = None,
+        max_array_length: int = None,
+    ):
+        self.max_depth = max_depth
+        self.max_nodes = max_nodes
+        self.max_string_length = max_string_length
+        self.max_array_length = max_array_length
+
+    @classmethod
+    def from_schema(cls, schema: Any, **overrides: Optional[int]) -> "Limits":
+        depth, nodes, length, size = _derive(schema)
+        limits = dict(
+            max_depth=depth,
+            max_nodes=nodes,
+            max_string_length=length,
+            max_array_length=size,
+        )
+        limits.update(overrides)
+        return cls(**limits)
+
+    def __repr__(self) -> str:
+        return (
+            f"Limits(max_depth={self.max_depth}, max_nodes={self.max_nodes}, "
+            f"max_string_length={self.max_string_length}, "
+            f"max_array_length={self.max_array_length})"
+        )
+
+    def check(self, value: Any) -> Any:
+        max_depth = self.max_depth
+        max_nodes = self.max_nodes
+        max_string = self.max_string_length
+        max_array = self.max_array_length
+        nodes = 1
+        stack = [(value, 0)]
+        while stack:
+            item, depth = stack.pop()
+            typ = type(item)
+            if typ is str:
+                if max_string is not None and len(item) > max_string:
+                    raise error.PropertyValidationError(
+                        f"Payload contains a string longer than {max_string}"
+                    )
+                continue
+            if typ is dict:
+                if max_string is not None:
+                    for key in item:
+                        if type(key) is str and len(key) > max_string:
+                            raise error.PropertyValidationError(
+                                f"Payload contains a key longer than {max_string}"
+                            )
+                items = item.values()
+            elif typ is list or typ is tuple:
+                if max_array is not None and len(item) > max_array:
+                    raise error.PropertyValidationError(
+                        f"Payload contains an array longer than {max_array}"
+                    )
+                items = item
+            else:
+                continue
+            depth += 1
+            if max_depth is not None and depth > max_depth:
+                raise error.PropertyValidationError(
+                    f"Payload is nested deeper than {max_depth}"
+                )
+            nodes += len(items)
+            if max_nodes is not None and nodes > max_nodes:
+                raise error.PropertyValidationError(
+                    f"Payload contains more than {max_nodes} values"
+                )
+            stack.extend((child, depth) for child in items)
+        return value
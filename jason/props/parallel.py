@@ -0,0 +1,85 @@
+import concurrent.futures
+from typing import Any, List, Optional, Sequence, Tuple, Type, Union
+
+from . import base, compiler, context, error, utils
+from .types import Array, Model, Nested, Property, Set
+from .types.array import convert
+
+CHUNK_SIZE = 10000
+
+_worker_schema = None
+
+
+def _init_worker(prop: base.SchemaAttribute, compiled: bool):
+    global _worker_schema
+    _worker_schema = Array(prop)
+    if compiled:
+        _worker_schema = compiler.compile(_worker_schema)
+
+
+def _load_chunk(
+    offset: int, chunk: List[Any], max_errors: Optional[int]
+) -> Tuple[List[Any], List[Tuple[int, Exception]]]:
+    with context.fail_fast(max_errors):
+        try:
+            return _worker_schema.load(chunk), []
+        except error.BatchValidationError as ex:
+            return [], [(offset + index, item) for index, item in ex.errors]
+
+
+def parallel_load(
+    schema: Union[Type[Model], Model, base.SchemaAttribute, Type[base.SchemaAttribute]],
+    items: Sequence[Any],
+    workers: int = None,
+    chunk_size: int = CHUNK_SIZE,
+    compiled: bool = False,
+) -> Any:
+    if utils.is_instance_or_type(schema, Model) and not isinstance(schema, Property):
+        schema = Nested(schema)
+    elif utils.is_type(schema):
+        schema = schema()
+    array = schema if isinstance(schema, Array) else Array(schema)
+    items = list(items)
+    if workers == 1 or len(items) <= chunk_size:
+        if compiled:
+            return compiler.compile(array).load(items)
+        return array.load(items)
+    array.range.validate(items)
+    validated = []
+    errors = []
+    count = 0
+    with context.fail_fast(array.max_errors) as max_errors:
+        with concurrent.futures.ProcessPoolExecutor(
+            workers, initializer=_init_worker, initargs=(array.prop, compiled)
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _load_chunk, offset, items[offset : offset + chunk_size], max_errors
+                )
+                for offset in range(0, len(items), chunk_size)
+            ]
+            for future in futures:
+                chunk, chunk_errors = future.result()
+                if not chunk_errors:
+                    validated.extend(chunk)
+                    continue
+                errors.extend(chunk_errors)
+                if not max_errors:
+                    continue
+                count += sum(getattr(ex, "count", 1) for _, ex in chunk_errors)
+                if count >= max_errors:
+                    for future in futures:
+                        future.cancel()
+                    raise error.BatchValidationError(
+                        "failed to validate array", errors, truncated=True
+                    )
+    if errors:
+        raise error.BatchValidationError("failed to validate array", errors)
+    if array.unique:
+        with context.fail_fast(array.max_errors):
+            array._check_unique(validated)
+    if isinstance(array, Set):
+        return Set._to_set(validated)
+    if array.output != "list":
+        return convert(array.prop, validated, array.output)
+    return validated
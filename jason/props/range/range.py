@@ -1,12 +1,42 @@
-from typing import Any
+import time
+from typing import Any, Tuple
 
-from .. import error, utils
+from .. import context, error, utils
 
 
 class RangeCheck:
-    def __init__(self, min_value: Any, max_value: Any):
+    def __init__(self, min_value: Any, max_value: Any, ttl: float = None):
         self.min_value = min_value
         self.max_value = max_value
+        self.ttl = ttl
+        self.dynamic = callable(min_value) or callable(max_value)
+        self._bounds = None
+        self._expires = 0
+        if not self.dynamic:
+            self._bounds = self._resolve()
+
+    def _resolve(self) -> Tuple[Any, Any]:
+        return tuple(
+            None if bound is None else self.mod_param(utils.maybe_call(bound))
+            for bound in (self.min_value, self.max_value)
+        )
+
+    def bounds(self) -> Tuple[Any, Any]:
+        if not self.dynamic:
+            return self._bounds
+        scope = context.bounds()
+        if scope is not None and self in scope:
+            return scope[self]
+        if self.ttl is None:
+            bounds = self._resolve()
+        elif time.monotonic() < self._expires:
+            bounds = self._bounds
+        else:
+            bounds = self._bounds = self._resolve()
+            self._expires = time.monotonic() + self.ttl
+        if scope is not None:
+            scope[self] = bounds
+        return bounds
 
     def raise_error(self, value: Any):
         min_msg = f"minimum: {self.min_value}" if self.min_value is not None else ""
@@ -16,17 +46,12 @@ class RangeCheck:
         )
 
     def validate(self, value: Any):
+        min_value, max_value = self.bounds()
         value = self.mod_value(value)
-        if self.min_value:
-            min_value = utils.maybe_call(self.min_value)
-            min_value = self.mod_param(min_value)
-            if value < min_value:
-                self.raise_error(value)
-        if self.max_value:
-            max_value = utils.maybe_call(self.max_value)
-            max_value = self.mod_param(max_value)
-            if value > max_value:
-                self.raise_error(value)
+        if min_value is not None and value < min_value:
+            self.raise_error(value)
+        if max_value is not None and value > max_value:
+            self.raise_error(value)
 
     def mod_value(self, value: Any) -> Any:
         return value
@@ -0,0 +1,67 @@
+import collections
+import keyword
+from typing import Any, Dict, Optional, Tuple
+
+OUTPUTS = ("dict", "slots", "tuple")
+
+_record_types = {}
+
+
+class Record:
+    __slots__ = ()
+    _fields = ()
+
+    def _asdict(self) -> Dict[str, Any]:
+        return {field: getattr(self, field) for field in self._fields}
+
+    def __eq__(self, other: Any) -> bool:
+        return type(other) is type(self) and all(
+            getattr(self, field) == getattr(other, field) for field in self._fields
+        )
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{f}={getattr(self, f)!r}" for f in self._fields)
+        return f"{type(self).__name__}({values})"
+
+    def __reduce__(self) -> Tuple:
+        return type(self), tuple(getattr(self, field) for field in self._fields)
+
+
+def _slots_type(name: str, fields: Tuple[str, ...]) -> type:
+    for field in fields:
+        if not field.isidentifier() or keyword.iskeyword(field) or field[0] == "_":
+            raise ValueError(f"'{field}' can not be used as a record field name")
+    args = "".join(f", {field}" for field in fields)
+    body = "".join(f"\n    _record.{field} = {field}" for field in fields)
+    namespace = {}
+    exec(f"def __init__(_record{args}):{body or ' pass'}", namespace)
+    attributes = {"__slots__": fields, "_fields": fields}
+    return type(name, (Record,), dict(attributes, __init__=namespace["__init__"]))
+
+
+def _tuple_type(name: str, fields: Tuple[str, ...]) -> type:
+    base = collections.namedtuple(name, fields)
+    return type(name, (base,), {"__slots__": ()})
+
+
+def record_type(name: str, fields: Tuple[str, ...], output: str) -> Optional[type]:
+    if output not in OUTPUTS:
+        raise ValueError(f"invalid output '{output}'. expected: {', '.join(OUTPUTS)}")
+    if output == "dict":
+        return None
+    key = (name, fields, output)
+    if key not in _record_types:
+        make = _slots_type if output == "slots" else _tuple_type
+        cls = make(name, fields)
+        cls.__module__ = __name__
+        cls.__qualname__ = f"{output}:{name}:{','.join(fields)}"
+        _record_types[key] = cls
+    return _record_types[key]
+
+
+def __getattr__(qualname: str) -> type:
+    try:
+        output, name, fields = qualname.split(":")
+    except ValueError:
+        raise AttributeError(f"module '{__name__}' has no attribute '{qualname}'")
+    return record_type(name, tuple(fields.split(",")) if fields else (), output)
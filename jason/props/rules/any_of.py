@@ -1,22 +1,60 @@
-from typing import Any, Type, Union
+from typing import Any, Dict, Tuple, Type, Union
 
 from .. import base, error, utils
+from ..types import Number, Property
+
+
+def _accepted_types(rule: base.SchemaAttribute) -> Union[Tuple[Type, ...], None]:
+    if not isinstance(rule, Property) or not rule.types or "load" in rule.__dict__:
+        return None
+    if type(rule).load is Property.load:
+        return tuple(rule.types)
+    if type(rule).load is Number.load:
+        return tuple(rule.types) + (str,)
+    return None
 
 
 class AnyOf(base.SchemaRule):
     def __init__(self, *rules: Union[base.SchemaAttribute, Type[base.SchemaAttribute]]):
-        self.rules = rules
+        self.rules = tuple(rule() if utils.is_type(rule) else rule for rule in rules)
+        self.accepted = tuple(_accepted_types(rule) for rule in self.rules)
+        self.index: Dict[Type, Tuple[int, ...]] = {}
+
+    def candidates(self, typ: Type) -> Tuple[int, ...]:
+        candidates = self.index.get(typ)
+        if candidates is None:
+            candidates = self.index[typ] = tuple(
+                i
+                for i, types in enumerate(self.accepted)
+                if types is None
+                or (bool in types if typ is bool else issubclass(typ, types))
+            )
+        return candidates
 
     def load(self, value: Any) -> Any:
-        errors = []
-        for rule in self.rules:
-            if utils.is_type(rule):
-                rule = rule()
-            try:
-                return rule.load(value)
-            except error.PropertyValidationError as ex:
-                errors.append(f"could not validate against '{rule}': {ex}")
-                continue
+        errors = [None] * len(self.rules)
+        if value is not None:
+            for i in self.candidates(type(value)):
+                try:
+                    return self.rules[i].load(value)
+                except (
+                    error.PropertyValidationError,
+                    error.BatchValidationError,
+                ) as ex:
+                    errors[i] = ex
+        for i, rule in enumerate(self.rules):
+            if errors[i] is None:
+                try:
+                    return rule.load(value)
+                except (
+                    error.PropertyValidationError,
+                    error.BatchValidationError,
+                ) as ex:
+                    errors[i] = ex
         raise error.BatchValidationError(
-            f"AllOf failed to validate value '{value}' with any rules", errors
+            f"AnyOf failed to validate value '{value}' with any rules",
+            [
+                f"could not validate against '{rule}': {ex}"
+                for rule, ex in zip(self.rules, errors)
+            ],
         )
@@ -1,11 +1,13 @@
-from .array import Array
+from .array import Array, Set
 from .bool import Bool
 from .choice import Choice
 from .compound import Compound
 from .inline import Inline
+from .map import Map
 from .model import Model
 from .nested import Nested
 from .number import Float, Int, Number
+from .one_of import OneOf
 from .property import Property
 from .string import Email, Password, Regex, String, Uuid
 from .time import Date, Datetime
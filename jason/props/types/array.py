@@ -1,7 +1,52 @@
-from typing import Any, Callable, List, Tuple, Type, Union
+import array
+import functools
+import operator
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
-from .. import base, error, range, utils
+from .. import base, context, error, range, utils
+from .bool import Bool
+from .number import Float, Int, Number
 from .property import Property
+from .string import String
+
+CANONICAL = object()
+BATCH_TYPES = {Int: (int,), Float: (int, float), Number: (int, float), Bool: (bool,)}
+BUFFER_TYPES = {
+    Int: ("q", "int64"),
+    Float: ("d", "float64"),
+    Number: ("d", "float64"),
+    Bool: ("b", "bool"),
+}
+
+
+def convert(prop: base.SchemaAttribute, values: Union[List, Tuple], output: str) -> Any:
+    if output == "list":
+        if type(prop) is Float:
+            return list(map(float, values))
+        return list(values)
+    typecode, dtype = BUFFER_TYPES[type(prop)]
+    try:
+        if output == "array":
+            return array.array(typecode, values)
+        import numpy
+
+        return numpy.array(values, dtype=dtype)
+    except OverflowError:
+        raise error.PropertyValidationError(
+            f"Array values do not fit in a buffer of type '{dtype}'"
+        )
 
 
 class Array(Property):
@@ -10,6 +55,11 @@ class Array(Property):
         prop: Union[base.SchemaAttribute, Type[base.SchemaAttribute]],
         min_length: Union[int, Callable[[], int]] = None,
         max_length: Union[int, Callable[[], int]] = None,
+        max_errors: int = None,
+        fail_fast: bool = False,
+        output: str = "list",
+        unique: bool = False,
+        unique_by: Union[str, Callable[[Any], Hashable]] = None,
         **kwargs: Any,
     ):
         if utils.is_type(prop):
@@ -17,21 +67,226 @@ class Array(Property):
         super(Array, self).__init__(types=(list, tuple), **kwargs)
         self.range = range.SizeRangeCheck(min_value=min_length, max_value=max_length)
         self.prop = prop
+        self.max_errors = 1 if fail_fast else max_errors
+        self.batch_types = None
+        if utils.is_plain(prop, (String,)):
+            self.batch_types = frozenset((str,))
+        elif utils.is_plain(prop, BATCH_TYPES):
+            self.batch_types = frozenset(
+                t for t in BATCH_TYPES[type(prop)] if t in prop.types
+            )
+        if output not in ("list", "array", "numpy"):
+            raise ValueError(f"invalid output '{output}'. expected: list, array, numpy")
+        if output != "list" and not utils.is_plain(prop, BUFFER_TYPES):
+            raise ValueError(
+                f"output '{output}' is only supported for arrays of Int, Float, Number or Bool"
+            )
+        if output == "numpy":
+            try:
+                import numpy  # noqa: F401
+            except ImportError:
+                raise ImportError(
+                    "package 'numpy' is not installed.\nYou can install it with:\npip3 install numpy"
+                )
+        self.output = output
+        self.unique = unique or unique_by is not None
+        self.unique_by = unique_by
 
     def _validate(self, value: Union[List, Tuple]) -> Union[List, Tuple]:
+        if self.max_errors or context.bounds() is None:
+            with context.load_scope(), context.fail_fast(self.max_errors):
+                return self._validate_items(value)
+        return self._validate_items(value)
+
+    def _validate_batch(self, value: Union[List, Tuple]) -> Optional[Any]:
+        if not value or not self.batch_types.issuperset(map(type, value)):
+            return None
+        rng = getattr(self.prop, "range", None)
+        low, high = (None, None) if rng is None else rng.bounds()
+        if low is None and high is None:
+            return self._convert(value)
+        if self.output == "numpy":
+            return self._validate_batch_numpy(value, low, high)
+        checked = value
+        if isinstance(rng, range.SizeRangeCheck):
+            checked = list(map(len, value))
+        if low is not None and not all(
+            map(functools.partial(operator.le, low), checked)
+        ):
+            return None
+        if high is not None and not all(
+            map(functools.partial(operator.ge, high), checked)
+        ):
+            return None
+        return self._convert(value)
+
+    def _validate_batch_numpy(
+        self, value: Union[List, Tuple], low: Any, high: Any
+    ) -> Optional[Any]:
+        import numpy
+
+        try:
+            validated = numpy.array(value, dtype=BUFFER_TYPES[type(self.prop)][1])
+        except OverflowError:
+            return None
+        if low is not None and (validated < low).any():
+            return None
+        if high is not None and (validated > high).any():
+            return None
+        return validated
+
+    def _convert(self, validated: Union[List, Tuple]) -> Any:
+        return convert(self.prop, validated, self.output)
+
+    def _validate_items(self, value: Union[List, Tuple]) -> Union[List, Tuple]:
 
         self.range.validate(value)
+        if self.batch_types:
+            validated = self._validate_batch(value)
+            if validated is not None:
+                if self.unique:
+                    self._check_unique(value)
+                return validated
         errors = []
         validated = []
-        for item in value:
+        max_errors = context.max_errors()
+        count = 0
+        for index, item in enumerate(value):
             try:
-                value = self.prop.load(item)
+                item = self.prop.load(item)
             except (error.PropertyValidationError, error.BatchValidationError) as ex:
-                errors.append(f"could not validate {value}: {ex}")
+                errors.append((index, ex))
+                if max_errors:
+                    count += getattr(ex, "count", 1)
+                    if count >= max_errors:
+                        raise error.BatchValidationError(
+                            "failed to validate array", errors, truncated=True
+                        )
                 continue
-            validated.append(value)
+            validated.append(item)
         if errors:
-            raise error.BatchValidationError(
-                f"failed to validate {value} against {self}", errors
-            )
+            raise error.BatchValidationError("failed to validate array", errors)
+        if self.unique:
+            self._check_unique(validated)
+        if self.output != "list":
+            return self._convert(validated)
         return validated
+
+    def _unique_key(self) -> Optional[Callable[[Any], Hashable]]:
+        if self.unique_by is None or callable(self.unique_by):
+            return self.unique_by
+        if getattr(self.prop, "record", None) is not None:
+            return operator.attrgetter(self.unique_by)
+        return operator.itemgetter(self.unique_by)
+
+    def _duplicate(
+        self,
+        unique_key: Optional[Callable[[Any], Hashable]],
+        seen: Dict,
+        unhashable: List,
+        item: Any,
+        index: int,
+    ) -> Any:
+        key = item if unique_key is None else unique_key(item)
+        try:
+            first = seen.setdefault(key, index)
+        except TypeError:
+            try:
+                first = seen.setdefault((CANONICAL, utils.canonical(key)), index)
+            except TypeError:
+                for seen_key, first in unhashable:
+                    if seen_key == key:
+                        break
+                else:
+                    unhashable.append((key, index))
+                    first = index
+        if first == index:
+            return None
+        if self.unique_by is None or callable(self.unique_by):
+            return error.PropertyValidationError(
+                f"Array item is a duplicate of item {first}"
+            )
+        return error.PropertyValidationError(
+            f"Array item has the same '{self.unique_by}' as item {first}"
+        )
+
+    def _check_unique(self, items: Union[List, Tuple]):
+        unique_key = self._unique_key()
+        if unique_key is None:
+            try:
+                if len(set(items)) == len(items):
+                    return
+            except TypeError:
+                pass
+        seen = {}
+        unhashable = []
+        errors = []
+        max_errors = context.max_errors()
+        for index, item in enumerate(items):
+            duplicate = self._duplicate(unique_key, seen, unhashable, item, index)
+            if duplicate is not None:
+                errors.append((index, duplicate))
+                if max_errors and len(errors) >= max_errors:
+                    raise error.BatchValidationError(
+                        "failed to validate array", errors, truncated=True
+                    )
+        if errors:
+            raise error.BatchValidationError("failed to validate array", errors)
+
+    def stream(self, items: Iterable[Any], max_errors: int = None) -> Iterator[Any]:
+        min_length, max_length = self.range.bounds()
+        for limit in (self.max_errors, context.max_errors()):
+            if limit and (not max_errors or limit < max_errors):
+                max_errors = limit
+        errors = []
+        count = 0
+        length = 0
+        unique_key = self._unique_key()
+        seen = {}
+        unhashable = []
+        for index, item in enumerate(items):
+            length = index + 1
+            if max_length is not None and length > max_length:
+                self.range.raise_error(length)
+            try:
+                item = self.prop.load(item)
+                if self.unique:
+                    duplicate = self._duplicate(
+                        unique_key, seen, unhashable, item, index
+                    )
+                    if duplicate is not None:
+                        raise duplicate
+            except (error.PropertyValidationError, error.BatchValidationError) as ex:
+                errors.append((index, ex))
+                if max_errors:
+                    count += getattr(ex, "count", 1)
+                    if count >= max_errors:
+                        raise error.BatchValidationError(
+                            "failed to validate array", errors, truncated=True
+                        )
+                continue
+            if not errors:
+                yield item
+        if errors:
+            raise error.BatchValidationError("failed to validate array", errors)
+        if min_length is not None and length < min_length:
+            self.range.raise_error(length)
+
+
+class Set(Array):
+    def __init__(
+        self,
+        prop: Union[base.SchemaAttribute, Type[base.SchemaAttribute]],
+        **kwargs: Any,
+    ):
+        super(Set, self).__init__(prop, unique=True, **kwargs)
+
+    def _validate(self, value: Union[List, Tuple]) -> set:
+        return self._to_set(super(Set, self)._validate(value))
+
+    @staticmethod
+    def _to_set(validated: Iterable[Any]) -> set:
+        try:
+            return set(validated)
+        except TypeError:
+            raise error.PropertyValidationError("Set items must be hashable")
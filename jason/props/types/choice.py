@@ -1,19 +1,79 @@
-from typing import Any, List
+import collections.abc
+from typing import Any, Callable, Iterable, Union
 
+from .. import cache as caching
 from .. import error
 from .property import Property
 
 
 class Choice(Property):
     def __init__(
-        self, choices: List = None, nullable: bool = False, default: Any = None
+        self,
+        choices: Union[Iterable, Callable[[], Iterable]] = None,
+        nullable: bool = False,
+        default: Any = None,
+        error_sample: int = 10,
+        cache: caching.LRU = None,
     ):
-        super(Choice, self).__init__(nullable=nullable, default=default)
+        super(Choice, self).__init__(nullable=nullable, default=default, cache=cache)
         self.choices = choices
+        self.error_sample = error_sample
+        self.index = None
+        self.unhashable = ()
+        self.sample = ()
+        self.size = 0
+        if not self.lazy:
+            self._build(choices)
+
+    @classmethod
+    def from_file(cls, path: str, **kwargs: Any) -> "Choice":
+        def read() -> Iterable[str]:
+            with open(path) as f:
+                return [line.strip() for line in f if line.strip()]
+
+        return cls(choices=read, **kwargs)
+
+    @property
+    def lazy(self) -> bool:
+        return callable(self.choices) and not isinstance(
+            self.choices, collections.abc.Iterable
+        )
+
+    def _build(self, choices: Iterable):
+        choices = list(choices or ())
+        try:
+            index = frozenset(choices)
+        except TypeError:
+            index = frozenset(c for c in choices if _hashable(c))
+            self.unhashable = tuple(c for c in choices if not _hashable(c))
+        self.sample = tuple(choices[: self.error_sample])
+        self.size = len(choices)
+        self.index = index
+
+    def contains(self, value: Any) -> bool:
+        try:
+            if value in self.index:
+                return True
+        except TypeError:
+            pass
+        return value in self.unhashable
 
     def _validate(self, value: Any) -> Any:
-        if self.choices and value not in self.choices:
+        if self.index is None:
+            self._build(self.choices())
+        if self.size and not self.contains(value):
+            shown = ", ".join(str(c) for c in self.sample)
+            if self.size > len(self.sample):
+                shown = f"{shown}, ... ({self.size - len(self.sample)} more)"
             raise error.PropertyValidationError(
-                f"Property was expected to be one of: {', '.join((str(c) for c in self.choices))}"
+                f"Property was expected to be one of: {shown}"
             )
         return value
+
+
+def _hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
@@ -6,6 +6,9 @@ from .nested import Nested
 
 
 class Inline(Model, Nested):
+    load_many = Nested.load_many
+    load_partial = Nested.load_partial
+
     def __init__(
         self,
         props: Dict[
@@ -0,0 +1,78 @@
+from typing import Any, Callable, Dict, Type, Union
+
+from .. import base, context, error, range, utils
+from .array import Array
+from .model import Model
+from .nested import Nested
+from .property import Property
+
+
+class Map(Property):
+    def __init__(
+        self,
+        keys: Union[base.SchemaAttribute, Type[base.SchemaAttribute]] = None,
+        values: Union[
+            Model, base.SchemaAttribute, Type[Model], Type[base.SchemaAttribute]
+        ] = None,
+        min_size: Union[int, Callable[[], int]] = None,
+        max_size: Union[int, Callable[[], int]] = None,
+        max_errors: int = None,
+        fail_fast: bool = False,
+        **kwargs: Any,
+    ):
+        if keys is None:
+            keys = Property(nullable=True)
+        if values is None:
+            values = Property(nullable=True)
+        if utils.is_type(keys):
+            keys = keys()
+        if utils.is_instance_or_type(values, Model) and not isinstance(
+            values, Property
+        ):
+            values = Nested(values)
+        elif utils.is_type(values):
+            values = values()
+        super(Map, self).__init__(types=(dict,), **kwargs)
+        self.range = range.SizeRangeCheck(min_value=min_size, max_value=max_size)
+        self.keys = keys
+        self.values = values
+        self.max_errors = 1 if fail_fast else max_errors
+        self.key_batch = Array(keys)
+        self.value_batch = Array(values)
+
+    def _validate(self, value: Dict[Any, Any]) -> Dict[Any, Any]:
+        if self.max_errors or context.bounds() is None:
+            with context.load_scope(), context.fail_fast(self.max_errors):
+                return self._validate_items(value)
+        return self._validate_items(value)
+
+    def _validate_items(self, value: Dict[Any, Any]) -> Dict[Any, Any]:
+        self.range.validate(value)
+        if self.key_batch.batch_types and self.value_batch.batch_types:
+            keys = self.key_batch._validate_batch(list(value))
+            if keys is not None:
+                values = self.value_batch._validate_batch(list(value.values()))
+                if values is not None:
+                    return dict(zip(keys, values))
+        errors = []
+        validated = {}
+        max_errors = context.max_errors()
+        count = 0
+        for key, item in value.items():
+            try:
+                try:
+                    loaded_key = self.keys.load(key)
+                except error.PropertyValidationError as ex:
+                    raise error.PropertyValidationError(f"Map key is invalid: {ex}")
+                validated[loaded_key] = self.values.load(item)
+            except (error.PropertyValidationError, error.BatchValidationError) as ex:
+                errors.append((key, ex))
+                if max_errors:
+                    count += getattr(ex, "count", 1)
+                    if count >= max_errors:
+                        raise error.BatchValidationError(
+                            "failed to validate map", errors, truncated=True
+                        )
+        if errors:
+            raise error.BatchValidationError("failed to validate map", errors)
+        return validated
@@ -1,8 +1,13 @@
+from typing import Any, Dict, Iterable, List, Union
+
 from .property import Property
 
 
 class Model:
     __strict__ = True
+    __max_errors__ = None
+    __output__ = "dict"
+    __cache__ = None
     __props__ = None
 
     def __init_subclass__(cls):
@@ -16,3 +21,17 @@ class Model:
             if isinstance(value, Property):
                 props[field] = value
         cls.__props__ = props
+
+    @classmethod
+    def load_many(
+        cls, rows: Iterable[Any], columnar: bool = False, output: str = "list"
+    ) -> Union[List[Any], Dict[str, Any]]:
+        from .nested import Nested
+
+        return Nested(cls).load_many(rows, columnar=columnar, output=output)
+
+    @classmethod
+    def load_partial(cls, delta: Dict[Any, Any], base: Any = None) -> Any:
+        from .nested import Nested
+
+        return Nested(cls).load_partial(delta, base=base)
@@ -1,31 +1,63 @@
-from typing import Any, Dict, Type, Union
+from typing import Any, Dict, Iterable, List, Optional, Type, Union
 
-from .. import error
+from .. import cache as caching
+from .. import context, error, record, utils
+from .array import BUFFER_TYPES, Array, convert
 from .model import Model
 from .property import Property
 
 
 class Nested(Property):
     def __init__(
-        self, model: Union[Type[Model], Model], strict: bool = None, **kwargs: Any
+        self,
+        model: Union[Type[Model], Model],
+        strict: bool = None,
+        max_errors: int = None,
+        fail_fast: bool = False,
+        output: str = None,
+        cache: caching.LRU = None,
+        **kwargs: Any,
     ):
-        super(Nested, self).__init__(types=(dict,), **kwargs)
+        if cache is None:
+            cache = getattr(model, "__cache__")
+        super(Nested, self).__init__(types=(dict,), cache=cache, **kwargs)
         self.props = model.__props__
         if strict is None:
             strict = getattr(model, "__strict__")
         self.strict = strict
+        if max_errors is None:
+            max_errors = getattr(model, "__max_errors__")
+        self.max_errors = 1 if fail_fast else max_errors
+        if output is None:
+            output = getattr(model, "__output__")
+        name = model.__name__ if isinstance(model, type) else type(model).__name__
+        self.record = record.record_type(name, tuple(self.props), output)
+        self.output = output
 
-    def _validate(self, obj: Dict[Any, Any]) -> Dict[Any, Any]:
+    def _validate(self, obj: Dict[Any, Any]) -> Any:
+        if self.max_errors or context.bounds() is None:
+            with context.load_scope(), context.fail_fast(self.max_errors):
+                return self._validate_fields(obj)
+        return self._validate_fields(obj)
+
+    def _validate_fields(self, obj: Dict[Any, Any]) -> Any:
 
         validated = {}
         errors = []
+        max_errors = context.max_errors()
+        count = 0
         for field, prop in self.props.items():
             value = obj.get(field, None)
             try:
                 validated[field] = prop.load(value)
             except (error.PropertyValidationError, error.BatchValidationError) as ex:
-                errors.append(f"could not load property '{field}': {ex}")
-                continue
+                errors.append((field, ex))
+                if max_errors:
+                    count += getattr(ex, "count", 1)
+                    if count >= max_errors:
+                        raise error.BatchValidationError(
+                            "failed to validate object", errors, truncated=True
+                        )
         if self.strict:
             extras = [k for k in obj if k not in self.props]
             if len(extras):
@@ -34,7 +66,155 @@ class Nested(Property):
                     f"'{', '.join(extras)}'"
                 )
         if errors:
-            raise error.BatchValidationError(
-                f"failed to validate {obj} against {self}", errors
+            raise error.BatchValidationError("failed to validate object", errors)
+        if self.record is not None:
+            return self.record(*validated.values())
+        return validated
+
+    def load_partial(self, delta: Dict[Any, Any], base: Any = None) -> Any:
+        if not isinstance(delta, dict):
+            raise error.PropertyValidationError(
+                f"Property was expected to be of type: dict. not {type(delta).__name__}"
             )
+        if base is not None and not isinstance(base, dict):
+            base = base._asdict()
+        with context.load_scope(), context.fail_fast(self.max_errors):
+            validated = self._validate_partial(delta, base)
+        if base is None:
+            return validated
+        merged = dict(base)
+        merged.update(validated)
+        if self.record is not None:
+            return self.record(*(merged[field] for field in self.props))
+        return merged
+
+    def _validate_partial(
+        self, delta: Dict[Any, Any], base: Optional[Dict[Any, Any]]
+    ) -> Dict[Any, Any]:
+        validated = {}
+        errors = []
+        max_errors = context.max_errors()
+        count = 0
+        for field, value in delta.items():
+            prop = self.props.get(field)
+            if prop is None:
+                continue
+            previous = None if base is None else base.get(field)
+            try:
+                if (
+                    isinstance(prop, Nested)
+                    and "_validate" not in prop.__dict__
+                    and isinstance(value, dict)
+                    and previous is not None
+                ):
+                    validated[field] = prop.load_partial(value, previous)
+                else:
+                    validated[field] = prop.load(value)
+            except (error.PropertyValidationError, error.BatchValidationError) as ex:
+                errors.append((field, ex))
+                if max_errors:
+                    count += getattr(ex, "count", 1)
+                    if count >= max_errors:
+                        raise error.BatchValidationError(
+                            "failed to validate object", errors, truncated=True
+                        )
+        if self.strict:
+            extras = [k for k in delta if k not in self.props]
+            if len(extras):
+                errors.append(
+                    f"Strict mode is True and supplied object contains extra keys: "
+                    f"'{', '.join(extras)}'"
+                )
+        if errors:
+            raise error.BatchValidationError("failed to validate object", errors)
         return validated
+
+    def load_many(
+        self, rows: Iterable[Any], columnar: bool = False, output: str = "list"
+    ) -> Union[List[Any], Dict[str, Any]]:
+        if not columnar:
+            return Array(self, max_errors=self.max_errors)._validate(list(rows))
+        if output not in ("list", "array", "numpy"):
+            raise ValueError(f"invalid output '{output}'. expected: list, array, numpy")
+        with context.load_scope(), context.fail_fast(self.max_errors):
+            return self._load_columns(rows, output)
+
+    def _load_columns(self, rows: Iterable[Any], output: str) -> Dict[str, Any]:
+        max_errors = context.max_errors()
+        indices = []
+        values = {field: [] for field in self.props}
+        type_errors = {}
+        extras = {}
+        for index, row in enumerate(rows):
+            if not isinstance(row, dict):
+                type_errors[index] = error.PropertyValidationError(
+                    f"Property was expected to be of type: dict. not {type(row).__name__}"
+                )
+                if max_errors and len(type_errors) >= max_errors:
+                    break
+                continue
+            indices.append(index)
+            for field, column in values.items():
+                column.append(row.get(field, None))
+            if self.strict:
+                keys = [k for k in row if k not in self.props]
+                if keys:
+                    extras[index] = keys
+        count = len(type_errors)
+        columns = {}
+        row_errors = {}
+        for field, prop in self.props.items():
+            if max_errors and count >= max_errors:
+                break
+            column_output = output
+            if prop.nullable or not utils.is_plain(prop, BUFFER_TYPES):
+                column_output = "list"
+            try:
+                with context.fail_fast(max_errors and max_errors - count):
+                    columns[field] = self._load_column(
+                        prop, values[field], column_output
+                    )
+            except error.BatchValidationError as ex:
+                count += ex.count
+                for position, field_error in ex.errors:
+                    row_errors.setdefault(indices[position], []).append(
+                        (field, field_error)
+                    )
+        for index, keys in extras.items():
+            if max_errors and count >= max_errors:
+                break
+            count += 1
+            row_errors.setdefault(index, []).append(
+                f"Strict mode is True and supplied object contains extra keys: "
+                f"'{', '.join(keys)}'"
+            )
+        if type_errors or row_errors:
+            for index, errors in row_errors.items():
+                type_errors[index] = error.BatchValidationError(
+                    "failed to validate object", errors
+                )
+            raise error.BatchValidationError(
+                "failed to validate array",
+                sorted(type_errors.items()),
+                truncated=bool(max_errors and count >= max_errors),
+            )
+        return columns
+
+    @staticmethod
+    def _load_column(prop: Property, values: List[Any], output: str) -> Any:
+        try:
+            return Array(prop, output=output)._validate_items(values)
+        except error.PropertyValidationError:
+            validated = Array(prop)._validate_items(values)
+        errors = []
+        max_errors = context.max_errors()
+        for position, value in enumerate(validated):
+            try:
+                convert(prop, [value], output)
+            except error.PropertyValidationError as ex:
+                errors.append((position, ex))
+                if max_errors and len(errors) >= max_errors:
+                    raise error.BatchValidationError(
+                        "failed to validate array", errors, truncated=True
+                    )
+        raise error.BatchValidationError("failed to validate array", errors)
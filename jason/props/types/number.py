@@ -11,10 +11,13 @@ class Number(Property):
         max_value: Union[Callable[[], int], int] = None,
         allow_strings: bool = True,
         types: Tuple[Type, ...] = (int, float, str),
+        bounds_ttl: float = None,
         **kwargs: Any,
     ):
         super(Number, self).__init__(types=types, **kwargs)
-        self.range = range.RangeCheck(min_value=min_value, max_value=max_value)
+        self.range = range.RangeCheck(
+            min_value=min_value, max_value=max_value, ttl=bounds_ttl
+        )
         self.allow_strings = allow_strings
 
     def _from_string(self, value: str) -> Union[int, float, None]:
@@ -0,0 +1,44 @@
+from typing import Any, Dict, Hashable, Type, Union
+
+from .. import base, error, utils
+from .model import Model
+from .nested import Nested
+from .property import Property
+
+
+class OneOf(Property):
+    def __init__(
+        self,
+        discriminator: str,
+        variants: Dict[
+            Hashable,
+            Union[Model, base.SchemaAttribute, Type[Model], Type[base.SchemaAttribute]],
+        ],
+        **kwargs: Any,
+    ):
+        super(OneOf, self).__init__(types=(dict,), **kwargs)
+        self.discriminator = discriminator
+        self.variants = {}
+        for tag, variant in variants.items():
+            if utils.is_instance_or_type(variant, Model) and not isinstance(
+                variant, Property
+            ):
+                variant = Nested(variant)
+            elif utils.is_type(variant):
+                variant = variant()
+            self.variants[tag] = variant
+
+    def _validate(self, value: Dict[Any, Any]) -> Any:
+        tag = value.get(self.discriminator, None)
+        try:
+            variant = self.variants[tag]
+        except (KeyError, TypeError):
+            if tag is None:
+                raise error.PropertyValidationError(
+                    f"Property is missing discriminator '{self.discriminator}'"
+                )
+            raise error.PropertyValidationError(
+                f"Discriminator '{self.discriminator}' was expected to be one of: "
+                f"{', '.join(str(t) for t in self.variants)}. not '{tag}'"
+            )
+        return variant.load(value)
@@ -1,6 +1,8 @@
-from typing import Any, Callable, List, Tuple, Type, Union
+from typing import Any, Callable, Hashable, List, Tuple, Type, Union
 
-from .. import base, error, utils
+from .. import base
+from .. import cache as caching
+from .. import error, utils
 
 
 class Property(base.SchemaAttribute):
@@ -9,10 +11,14 @@ class Property(base.SchemaAttribute):
         nullable: bool = False,
         default: Any = None,
         types: Union[Tuple[Type, ...], List[Type]] = None,
+        cache: caching.LRU = None,
     ):
         self.nullable = nullable
         self.default = default
         self.types = types
+        self.cache = cache
+        if cache is not None:
+            self.load = caching.Memoized(self, cache)
 
     def load(self, value: Any) -> Any:
         if value is None:
@@ -34,17 +40,26 @@ class Property(base.SchemaAttribute):
     def _validate(self, value: Any) -> Any:
         return value
 
+    validators = ()
+
     def __call__(self, func: Callable[[Any], Any]) -> "Property":
-        base_validator = self._validate
+        if not self.validators:
+            self._validate = self._validate_pipeline
+        self.validators = self.validators + (func,)
+        return self
 
-        def wrapped_validator(value: Any) -> Any:
-            value = base_validator(value)
-            return func(value)
+    def _validate_pipeline(self, value: Any) -> Any:
+        value = type(self)._validate(self, value)
+        for validator in self.validators:
+            value = validator(value)
+        return value
 
-        self._validate = wrapped_validator
-        return self
+    def fingerprint(self) -> Hashable:
+        return utils.fingerprint(self)
 
     def is_identical_to(self, other):
+        if other is self:
+            return True
         if not isinstance(other, type(self)):
             return False
-        return utils.deep_compare(self, other)
+        return utils.equivalent(self, other)
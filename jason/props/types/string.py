@@ -1,4 +1,5 @@
 import re
+import string
 import uuid
 from typing import Any, Callable, Pattern, Union
 
@@ -27,10 +28,11 @@ class Regex(String):
         if isinstance(matcher, str):
             matcher = re.compile(matcher)
         self.matcher = matcher
+        self.match = matcher.match
 
     def _validate(self, value: str) -> str:
         value = super(Regex, self)._validate(value)
-        if re.match(self.matcher, value) is None:
+        if self.match(value) is None:
             raise error.PropertyValidationError(
                 f"String value '{value}' did not match regex pattern '{self.matcher.pattern}'"
             )
@@ -38,11 +40,17 @@ class Regex(String):
 
 
 class Uuid(String):
+    canonical = re.compile(
+        "[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"
+    ).fullmatch
+
     def __init__(self, **kwargs):
         super(Uuid, self).__init__(**kwargs)
 
     def _validate(self, value: str) -> str:
         value = super(Uuid, self)._validate(value)
+        if len(value) == 36 and self.canonical(value) is not None:
+            return value
         try:
             uuid.UUID(value)
         except ValueError:
@@ -51,9 +59,9 @@ class Uuid(String):
 
 
 class Password(String):
-    uppercase_matcher = re.compile("[A-Z]")
-    numbers_matcher = re.compile("[0-9]")
-    symbols_matcher = re.compile("[^A-Za-z0-9]")
+    uppercase_chars = frozenset(string.ascii_uppercase)
+    number_chars = frozenset(string.digits)
+    alphanumeric_chars = frozenset(string.ascii_letters + string.digits)
     whitespace_matcher = re.compile("[\\s]")
     max_score = 3
 
@@ -73,13 +81,14 @@ class Password(String):
 
     def _validate(self, value: str) -> str:
         value = super(Password, self)._validate(value)
-        score = 0
-        if re.search(self.whitespace_matcher, value):
+        if self.whitespace_matcher.search(value):
             raise error.PropertyValidationError(
                 f"Password must not contain white space"
             )
+        chars = frozenset(value)
+        score = 0
 
-        if re.search(self.uppercase_matcher, value):
+        if not chars.isdisjoint(self.uppercase_chars):
             if self.uppercase is False:
                 raise error.PropertyValidationError(
                     f"Password must not contain uppercase characters"
@@ -90,7 +99,7 @@ class Password(String):
                 f"Password must contain at least 1 uppercase character"
             )
 
-        if re.search(self.numbers_matcher, value):
+        if not chars.isdisjoint(self.number_chars):
             if self.numbers is False:
                 raise error.PropertyValidationError(
                     f"Password must not contain numbers"
@@ -101,7 +110,7 @@ class Password(String):
                 f"Password must contain at least 1 number"
             )
 
-        if re.search(self.symbols_matcher, value):
+        if not chars <= self.alphanumeric_chars:
             if self.symbols is False:
                 raise error.PropertyValidationError(
                     f"Password must not contain symbol characters"
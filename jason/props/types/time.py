@@ -11,10 +11,13 @@ class Date(Property):
         min_value: Union[Callable[[], int], int, str] = None,
         max_value: Union[Callable[[], int], int, str] = None,
         allow_strings: bool = True,
+        bounds_ttl: float = None,
         **kwargs: Any,
     ):
         super(Date, self).__init__(types=(datetime.date, str), **kwargs)
-        self.range = range.RangeCheck(min_value=min_value, max_value=max_value)
+        self.range = range.DateTimeRangeCheck(
+            min_value=min_value, max_value=max_value, ttl=bounds_ttl
+        )
         self.allow_strings = allow_strings
 
     def _from_string(self, value: str) -> datetime.date:
@@ -44,10 +47,13 @@ class Datetime(Property):
         min_value: Union[Callable[[], int], int, str] = None,
         max_value: Union[Callable[[], int], int, str] = None,
         allow_strings: bool = True,
+        bounds_ttl: float = None,
         **kwargs: Any,
     ):
         super(Datetime, self).__init__(types=(datetime.datetime, str), **kwargs)
-        self.range = range.DateTimeRangeCheck(min_value=min_value, max_value=max_value)
+        self.range = range.DateTimeRangeCheck(
+            min_value=min_value, max_value=max_value, ttl=bounds_ttl
+        )
         self.allow_strings = allow_strings
 
     def _from_string(self, value: str) -> datetime.datetime:
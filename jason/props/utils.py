@@ -1,3 +1,6 @@
+import types
+
+
 def maybe_call(value):
     if callable(value):
         return value()
@@ -20,6 +23,14 @@ def is_instance_or_type(value, typ):
     return is_type(value, typ=typ) or isinstance(value, typ)
 
 
+def is_plain(value, types):
+    return (
+        type(value) in types
+        and "_validate" not in getattr(value, "__dict__", {})
+        and "load" not in getattr(value, "__dict__", {})
+    )
+
+
 def deep_compare(base, compare):
     if not hasattr(base, "__dict__") or not hasattr(compare, "__dict__"):
         return base == compare
@@ -31,3 +42,88 @@ def deep_compare(base, compare):
         if not deep_compare(value, compare.__dict__[key]):
             return False
     return True
+
+
+def canonical(value):
+    typ = type(value)
+    if typ is dict:
+        return dict, frozenset((k, canonical(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return list, tuple(canonical(item) for item in value)
+    if isinstance(value, tuple):
+        return tuple, tuple(canonical(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset, frozenset(value)
+    if hasattr(value, "_fields") and hasattr(value, "__slots__"):
+        return typ, tuple(canonical(getattr(value, f)) for f in value._fields)
+    hash(value)
+    return value
+
+
+def _unbound(attribute, owner):
+    if isinstance(attribute, types.MethodType) and attribute.__self__ is owner:
+        return attribute.__func__
+    return attribute
+
+
+def fingerprint(value, memo=None):
+    if memo is None:
+        memo = {}
+    key = id(value)
+    if key in memo:
+        return memo[key]
+    memo[key] = ("cycle", key)
+    typ = type(value)
+    if isinstance(value, (type, types.FunctionType, types.BuiltinFunctionType)):
+        result = value
+    elif typ in (list, tuple):
+        result = (typ, tuple(fingerprint(item, memo) for item in value))
+    elif typ is dict:
+        result = (typ, tuple((k, fingerprint(v, memo)) for k, v in value.items()))
+    elif hasattr(value, "__dict__"):
+        attributes = []
+        for name, attribute in value.__dict__.items():
+            attributes.append((name, fingerprint(_unbound(attribute, value), memo)))
+        result = (typ, tuple(sorted(attributes, key=lambda item: item[0])))
+    else:
+        try:
+            hash(value)
+            result = (typ, value)
+        except TypeError:
+            result = (typ, key)
+    memo[key] = result
+    return result
+
+
+def equivalent(a, b, memo=None):
+    if a is b:
+        return True
+    typ = type(a)
+    if type(b) is not typ:
+        return False
+    if memo is None:
+        memo = set()
+    key = (id(a), id(b))
+    if key in memo:
+        return True
+    memo.add(key)
+    if isinstance(a, (type, types.FunctionType, types.BuiltinFunctionType)):
+        return False
+    if typ in (list, tuple):
+        return len(a) == len(b) and all(equivalent(x, y, memo) for x, y in zip(a, b))
+    if typ is dict:
+        return list(a) == list(b) and all(
+            equivalent(value, b[k], memo) for k, value in a.items()
+        )
+    if hasattr(a, "__dict__"):
+        if a.__dict__.keys() != b.__dict__.keys():
+            return False
+        return all(
+            equivalent(_unbound(value, a), _unbound(b.__dict__[name], b), memo)
+            for name, value in a.__dict__.items()
+        )
+    try:
+        hash(a)
+    except TypeError:
+        return False
+    return a == b
@@ -1,5 +1,8 @@
+from .cache import TokenCache
 from .error import BatchValidationError, TokenValidationError
 from .handler import Handler
+from .key_ring import KeyRing
+from .lazy import LazyToken, current_token
 from .protect import Protect
 from .rules import AllOf, AnyOf, HasKeys, HasScopes, HasValue, MatchValues, NoneOf
 
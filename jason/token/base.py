@@ -3,6 +3,7 @@ from typing import Any, Dict, NoReturn
 
 class TokenHandlerBase:
     G_KEY = "_ACCESS_TOKEN"
+    RAW_KEY = "_RAW_ACCESS_TOKEN"
 
 
 class TokenRule:
@@ -0,0 +1,76 @@
+import collections
+import hashlib
+import threading
+import time
+from typing import Any, Dict, Optional, Union
+
+CacheInfo = collections.namedtuple(
+    "CacheInfo", ("hits", "misses", "expired", "evictions", "size", "maxsize")
+)
+
+
+class TokenCache:
+    def __init__(self, maxsize: int = 1024, ttl: float = None):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries = collections.OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+
+    @staticmethod
+    def digest(token_string: Union[str, bytes]) -> bytes:
+        if isinstance(token_string, str):
+            token_string = token_string.encode()
+        return hashlib.sha256(token_string).digest()
+
+    def get(self, token_string: Union[str, bytes]) -> Optional[Dict[str, Any]]:
+        key = self.digest(token_string)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires, token_data = entry
+            if time.time() >= expires:
+                del self.entries[key]
+                self.expired += 1
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+        return dict(token_data)
+
+    def put(self, token_string: Union[str, bytes], token_data: Dict[str, Any]):
+        expires = token_data.get("exp")
+        if self.ttl is not None:
+            ttl_expires = time.time() + self.ttl
+            if not isinstance(expires, (int, float)) or ttl_expires < expires:
+                expires = ttl_expires
+        if not isinstance(expires, (int, float)) or isinstance(expires, bool):
+            return
+        key = self.digest(token_string)
+        with self.lock:
+            self.entries[key] = (expires, dict(token_data))
+            self.entries.move_to_end(key)
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(
+            self.hits,
+            self.misses,
+            self.expired,
+            self.evictions,
+            len(self.entries),
+            self.maxsize,
+        )
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
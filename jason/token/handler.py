@@ -1,36 +1,49 @@
 import json
 import time
+import types
 from typing import Any, Dict, NoReturn
 
 import flask
 import jwt
+from jwt import algorithms
 
 from jason import crypto
 
 from . import base
+from .cache import TokenCache
+from .key_ring import KeyRing
+from .lazy import LazyToken, resolve
 
 
 class Handler(base.TokenHandlerBase):
     HEADER_KEY = "Authorization"
     CIPHER = crypto.ChaCha20
 
-    DECODER_OPTIONS = {
-        "require_exp": True,
-        "require_nbf": True,
-        "require_iat": True,
-        "require_aud": True,
-        "require_iss": True,
-        "verify_exp": True,
-        "verify_nbf": True,
-        "verify_iat": True,
-        "verify_aud": True,
-        "verify_iss": True,
-        "verify_signature": True,
-    }
+    DECODER_OPTIONS = types.MappingProxyType(
+        {
+            "require_exp": True,
+            "require_nbf": True,
+            "require_iat": True,
+            "require_aud": True,
+            "require_iss": True,
+            "verify_exp": True,
+            "verify_nbf": True,
+            "verify_iat": True,
+            "verify_aud": True,
+            "verify_iss": True,
+            "verify_signature": True,
+        }
+    )
 
     def __init__(self, app: flask.Flask = None, **kwargs: Any):
         self.app = app
         self.key = None
+        self.signing_key = None
+        self.verification_key = None
+        self.encode_key = None
+        self.decode_key = None
+        self.decoder_options = dict(self.DECODER_OPTIONS)
+        self.key_ring = None
         self.lifespan = None
         self.issuer = None
         self.audience = None
@@ -38,6 +51,10 @@ class Handler(base.TokenHandlerBase):
         self.verify = None
         self.auto_update = None
         self.cipher = None
+        self.cache = None
+        self.lazy = None
+        self.refresh_window = None
+        self.refresh_ratio = None
         self.init_app(app)
         self.configure(**kwargs)
 
@@ -52,7 +69,7 @@ class Handler(base.TokenHandlerBase):
 
     def configure(
         self,
-        key: str = None,
+        key: Any = None,
         lifespan: int = None,
         issuer: str = None,
         audience: str = None,
@@ -60,10 +77,27 @@ class Handler(base.TokenHandlerBase):
         verify: bool = None,
         auto_update: bool = None,
         encryption_key: str = None,
+        cache_size: int = None,
+        cache_ttl: float = None,
+        lazy: bool = None,
+        refresh_window: float = None,
+        refresh_ratio: float = None,
+        signing_key: Any = None,
+        verification_key: Any = None,
+        key_ring: KeyRing = None,
         **kwargs: Any,
     ) -> NoReturn:
+        if self.cache is not None:
+            self.cache.clear()
         if key is not None:
             self.key = key
+        if signing_key is not None:
+            self.signing_key = signing_key
+        if verification_key is not None:
+            self.verification_key = verification_key
+        if key_ring is not None:
+            self.key_ring = key_ring
+            key_ring.listeners.append(self.keys_removed)
         if lifespan is not None:
             self.lifespan = lifespan
         if issuer is not None:
@@ -78,39 +112,100 @@ class Handler(base.TokenHandlerBase):
             self.auto_update = auto_update
         if encryption_key is not None:
             self.cipher = self.CIPHER(encryption_key)
-        for key, value in kwargs.items():
-            if key not in self.DECODER_OPTIONS:
-                raise ValueError(f"invalid keyword argument {key}")
-            self.DECODER_OPTIONS[key] = value
+        if lazy is not None:
+            self.lazy = lazy
+        if refresh_window is not None:
+            self.refresh_window = refresh_window
+        if refresh_ratio is not None:
+            self.refresh_ratio = refresh_ratio
+        if cache_size is not None:
+            self.cache = TokenCache(cache_size, ttl=cache_ttl) if cache_size else None
+        for name in kwargs:
+            if name not in self.DECODER_OPTIONS:
+                raise ValueError(f"invalid keyword argument {name}")
+        if kwargs:
+            self.decoder_options = dict(self.decoder_options, **kwargs)
+        self.encode_key = None
+        self.decode_key = None
+        if self.algorithm is not None:
+            self.prepare_keys()
+
+    def prepare_keys(self) -> NoReturn:
+        signing_key = self.signing_key if self.signing_key is not None else self.key
+        verification_key = self.verification_key
+        if verification_key is None:
+            verification_key = self.key
+        if signing_key is None and verification_key is None:
+            return
+        name = self.algorithm or "HS256"
+        algorithm = algorithms.get_default_algorithms().get(name)
+        if algorithm is None:
+            if name in algorithms.requires_cryptography:
+                raise ImportError(
+                    f"package 'cryptography' is required for algorithm '{name}'.\n"
+                    f"You can install it with:\npip3 install cryptography"
+                )
+            raise ValueError(f"unsupported algorithm '{name}'")
+        if signing_key is not None:
+            self.encode_key = algorithm.prepare_key(signing_key)
+        if verification_key is not None:
+            self.decode_key = algorithm.prepare_key(verification_key)
+            if hasattr(self.decode_key, "public_key"):
+                self.decode_key = self.decode_key.public_key()
 
     def _encode(
         self, token_data: Dict[str, Any], json_encoder: Any = json.JSONEncoder
     ) -> str:
+        if self.key_ring is not None and self.key_ring.signing_kid is not None:
+            algorithm, key = self.key_ring.signing_key()
+            return jwt.encode(
+                payload=token_data,
+                key=key,
+                algorithm=algorithm,
+                json_encoder=json_encoder,
+                headers={"kid": self.key_ring.signing_kid},
+            )
+        if self.encode_key is None:
+            self.prepare_keys()
+        if self.encode_key is None:
+            raise ValueError("Handler has no signing key")
         return jwt.encode(
             payload=token_data,
-            key=self.key,
+            key=self.encode_key,
             algorithm=self.algorithm,
             json_encoder=json_encoder,
         )
 
     def _decode(self, token_string: str) -> Dict[str, Any]:
+        if self.decode_key is None:
+            self.prepare_keys()
+        key = self.decode_key
+        algorithm = self.algorithm
+        if self.key_ring is not None:
+            kid = jwt.get_unverified_header(token_string).get("kid")
+            if kid is not None or key is None:
+                algorithm, key = self.key_ring.get(kid)
         return jwt.decode(
             jwt=token_string,
-            key=self.key,
+            key=key,
             verify=self.verify,
-            algorithms=[self.algorithm],
-            options=self.DECODER_OPTIONS,
+            algorithms=[algorithm],
+            options=self.decoder_options,
             issuer=self.issuer,
             audience=self.audience,
         )
 
+    def keys_removed(self, kids: frozenset) -> NoReturn:
+        if self.cache is not None:
+            self.cache.clear()
+
     def before_first_request(self) -> NoReturn:
         missing = []
         if self.algorithm is None:
             self.algorithm = "HS256"
         if self.lifespan is None:
             missing.append("lifespan")
-        if self.key is None:
+        if self.key is None and self.verification_key is None and self.key_ring is None:
             missing.append("key")
         if self.verify is None:
             self.verify = True
@@ -118,20 +213,54 @@ class Handler(base.TokenHandlerBase):
             raise ValueError(
                 "Handler is missing the values for: " f"{', '.join(missing)}"
             )
+        self.prepare_keys()
+        if self.key_ring is not None:
+            self.key_ring.start()
 
     def before_request(self) -> NoReturn:
         token_string = flask.request.headers.get(self.HEADER_KEY, None)
         if not token_string:
             return
+        flask.g[self.RAW_KEY] = token_string
+        if self.lazy:
+            flask.g[self.G_KEY] = LazyToken(self, token_string)
+        else:
+            flask.g[self.G_KEY] = self.load_token(token_string)
+
+    def load_token(self, token_string: str) -> Dict[str, Any]:
+        if self.cache is None:
+            return self._decrypt_and_decode(token_string)
+        token_data = self.cache.get(token_string)
+        if token_data is None:
+            token_data = self._decrypt_and_decode(token_string)
+            self.cache.put(token_string, token_data)
+        return token_data
+
+    def _decrypt_and_decode(self, token_string: str) -> Dict[str, Any]:
         if self.cipher:
             token_string = self.cipher.decrypt(token_string)
-        token_data = self._decode(token_string)
-        flask.g[self.G_KEY] = token_data
+        return self._decode(token_string)
+
+    def needs_refresh(self, token_data: Dict[str, Any]) -> bool:
+        if self.refresh_window is None and self.refresh_ratio is None:
+            return True
+        expires = token_data.get("exp")
+        if not isinstance(expires, (int, float)):
+            return True
+        window = max(
+            self.refresh_window or 0, (self.refresh_ratio or 0) * self.lifespan
+        )
+        return expires - time.time() < window
 
     def after_request(self, response: flask.Response) -> flask.Response:
         if not self.auto_update:
             return response
-        token_data = flask.g[self.G_KEY]
+        token_data = resolve(flask.g[self.G_KEY])
+        if not self.needs_refresh(token_data):
+            token_string = flask.g.get(self.RAW_KEY, None)
+            if token_string:
+                response.headers[self.HEADER_KEY] = token_string
+            return response
         token_data["exp"] = time.time() + self.lifespan
         token_string = self._encode(token_data=token_data)
         if self.cipher:
@@ -158,6 +287,11 @@ class Handler(base.TokenHandlerBase):
         try:
             return super(Handler, self).__getattribute__(item)
         except AttributeError:
-            if item in self.DECODER_OPTIONS:
-                return self.DECODER_OPTIONS[item]
+            options = (
+                super(Handler, self)
+                .__getattribute__("__dict__")
+                .get("decoder_options", self.DECODER_OPTIONS)
+            )
+            if item in options:
+                return options[item]
             raise
@@ -0,0 +1,114 @@
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, List, Tuple
+
+import jwt
+from jwt import algorithms, exceptions
+
+
+class KeyRing:
+    def __init__(
+        self,
+        path: str,
+        algorithm: str = None,
+        signing_kid: str = None,
+        interval: float = 30.0,
+    ):
+        self.path = path
+        self.algorithm = algorithm
+        self.signing_kid = signing_kid
+        self.interval = interval
+        self.keys: Dict[str, Tuple[str, Any, Any]] = {}
+        self.jwks: Dict[str, Dict[str, Any]] = {}
+        self.listeners: List[Callable[[frozenset], None]] = []
+        self.version = None
+        self.error = None
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.thread = None
+        self.reload()
+
+    def parse(self, jwks: Dict[str, Any]) -> Dict[str, Tuple[str, Any, Any]]:
+        supported = algorithms.get_default_algorithms()
+        keys = {}
+        for jwk in jwks.get("keys", ()):
+            kid = jwk.get("kid")
+            if kid is None:
+                raise ValueError("key ring keys must have a 'kid'")
+            name = jwk.get("alg", self.algorithm)
+            if name is None:
+                raise ValueError(f"key '{kid}' has no 'alg' and no default was set")
+            if name == "none":
+                raise ValueError(f"key '{kid}' can not use algorithm 'none'")
+            algorithm = supported.get(name)
+            if algorithm is None:
+                raise ValueError(f"key '{kid}' uses unsupported algorithm '{name}'")
+            try:
+                key = algorithm.from_jwk(json.dumps(jwk))
+            except (KeyError, exceptions.InvalidKeyError) as ex:
+                raise ValueError(f"key '{kid}' is invalid: {ex}")
+            public_key = key.public_key() if hasattr(key, "public_key") else key
+            keys[kid] = (name, key, public_key)
+        return keys
+
+    def reload(self) -> bool:
+        with self.lock:
+            stat = os.stat(self.path)
+            version = (stat.st_mtime_ns, stat.st_size)
+            if version == self.version:
+                return False
+            with open(self.path) as f:
+                jwks = json.load(f)
+            keys = self.parse(jwks)
+            jwks = {jwk["kid"]: jwk for jwk in jwks.get("keys", ())}
+            removed = frozenset(
+                kid for kid, jwk in self.jwks.items() if jwks.get(kid) != jwk
+            )
+            self.keys = keys
+            self.jwks = jwks
+            self.version = version
+        if removed:
+            for listener in self.listeners:
+                listener(removed)
+        return True
+
+    def refresh(self) -> bool:
+        try:
+            changed = self.reload()
+        except Exception as ex:
+            self.error = ex
+            return False
+        self.error = None
+        return changed
+
+    def get(self, kid: str) -> Tuple[str, Any]:
+        try:
+            name, _, public_key = self.keys[kid]
+        except KeyError:
+            raise jwt.InvalidTokenError(f"token signed with an unknown key '{kid}'")
+        return name, public_key
+
+    def signing_key(self) -> Tuple[str, Any]:
+        try:
+            name, key, _ = self.keys[self.signing_kid]
+        except KeyError:
+            raise ValueError(f"key ring has no signing key '{self.signing_kid}'")
+        return name, key
+
+    def start(self):
+        if self.thread is not None or not self.interval:
+            return
+        self.stopped.clear()
+        self.thread = threading.Thread(target=self.watch, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def watch(self):
+        while not self.stopped.wait(self.interval):
+            self.refresh()
@@ -0,0 +1,52 @@
+import collections.abc
+from typing import Any, Dict, Iterator, Optional
+
+import flask
+
+from . import base
+
+
+class LazyToken(collections.abc.MutableMapping):
+    def __init__(self, handler: Any, token_string: str):
+        self.handler = handler
+        self.token_string = token_string
+        self.token_data = None
+
+    @property
+    def loaded(self) -> bool:
+        return self.token_data is not None
+
+    def load(self) -> Dict[str, Any]:
+        if self.token_data is None:
+            self.token_data = self.handler.load_token(self.token_string)
+        return self.token_data
+
+    def __getitem__(self, key: str) -> Any:
+        return self.load()[key]
+
+    def __setitem__(self, key: str, value: Any):
+        self.load()[key] = value
+
+    def __delitem__(self, key: str):
+        del self.load()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.load())
+
+    def __len__(self) -> int:
+        return len(self.load())
+
+    def __repr__(self) -> str:
+        if self.token_data is None:
+            return "LazyToken(<not loaded>)"
+        return f"LazyToken({self.token_data!r})"
+
+
+def resolve(token: Any) -> Any:
+    if isinstance(token, LazyToken):
+        return token.load()
+    return token
+
+
+def current_token() -> Optional[Dict[str, Any]]:
+    return resolve(flask.g.get(base.TokenHandlerBase.G_KEY, None))
@@ -6,6 +6,7 @@ import flask
 from ..error import BatchValidationError
 from ..exception import Unauthorized
 from . import base, rules
+from .lazy import resolve
 
 
 class Protect(base.TokenHandlerBase):
@@ -15,7 +16,7 @@ class Protect(base.TokenHandlerBase):
     def __call__(self, func: Callable) -> Callable:
         @functools.wraps(func)
         def call(*args: Any, **kwargs: Any) -> Any:
-            token = flask.g[self.G_KEY]
+            token = resolve(flask.g[self.G_KEY])
             try:
                 self.rules.validate(token)
             except BatchValidationError as ex:
@@ -2,6 +2,8 @@ from datetime import date, datetime
 
 import flask.json
 
+from jason.props.record import Record
+
 
 class JSONEncoder(flask.json.JSONEncoder):
     _object_encoders = {}
@@ -69,6 +71,8 @@ class JSONEncoder(flask.json.JSONEncoder):
             return self._object_encoders[obj_type](obj)
         if obj_type in self._auto_encoders:
             return self._auto_encode(obj, self._auto_encoders[obj_type])
+        if isinstance(obj, Record):
+            return obj._asdict()
         if isinstance(obj, datetime):
             return obj.isoformat()
         if isinstance(obj, date):
@@ -1,13 +1,15 @@
 import functools
 import inspect
-from typing import Any, Callable, Dict, Optional, Type
+import json
+from typing import Any, Callable, Dict, Iterator, Optional, Type, Union
 
 from flask import request
 
-from jason.props import base, error, types, utils
+from jason.props import base, compiler, context, error, limits, types, utils
 
 from ..error import BatchValidationError
-from ..exception import BadRequest
+from ..exception import BadRequest, RequestEntityTooLarge
+from .stream import iter_json_array
 
 
 class RequestSchema:
@@ -18,6 +20,11 @@ class RequestSchema:
         json: types.Model = None,
         query: types.Model = None,
         form: types.Model = None,
+        compiled: bool = False,
+        max_errors: int = None,
+        stream: bool = False,
+        limits: Union[bool, "limits.Limits"] = None,
+        max_body_size: int = None,
     ):
         self.args = (
             args if args is not None else self.from_model(model, "Args", default=False)
@@ -33,6 +40,32 @@ class RequestSchema:
         self.form = (
             form if form is not None else self.from_model(model, "Form", default=False)
         )
+        self.max_errors = max_errors
+        self.stream = stream
+        if stream and not isinstance(self.json, types.Array):
+            raise ValueError("streaming requires the json schema to be an Array")
+        if limits is True:
+            limits = self.derive_limits(self.json.prop if stream else self.json)
+        self.limits = limits or None
+        self.max_body_size = max_body_size
+        if compiled:
+            self.args = self.compile(self.args)
+            if not stream:
+                self.json = self.compile(self.json)
+            self.query = self.compile(self.query)
+            self.form = self.compile(self.form)
+
+    @staticmethod
+    def derive_limits(schema: Any) -> "limits.Limits":
+        if not utils.is_instance_or_type(schema, base.SchemaAttribute):
+            raise ValueError("limits can only be derived from a json schema")
+        return limits.Limits.from_schema(schema)
+
+    @staticmethod
+    def compile(schema: Any) -> Any:
+        if utils.is_instance_or_type(schema, base.SchemaAttribute):
+            return compiler.compile(schema)
+        return schema
 
     @staticmethod
     def load(
@@ -47,7 +80,7 @@ class RequestSchema:
                 if name in func_params:
                     kwargs[name] = data
             except (error.PropertyValidationError, error.BatchValidationError) as ex:
-                errors.append(f"failed to load {name}: {ex}")
+                errors.append((name, ex))
         if errors:
             raise error.BatchValidationError("failed to validate request", errors)
         return kwargs
@@ -92,19 +125,66 @@ class RequestSchema:
         return request.form
 
     def load_json(self) -> Optional[Dict[str, Any]]:
+        if self.stream:
+            if request.is_json is False:
+                raise error.RequestValidationError("request requires a json body")
+            items = iter_json_array(request.stream)
+            if self.limits is not None:
+                items = map(self.limits.check, items)
+            return self.iter_json(self.json.stream(items, max_errors=self.max_errors))
         if self.json is True:
             if request.is_json is False:
                 raise error.RequestValidationError("request requires a json body")
-            return request.json
+            return self.check_limits(request.json)
         if self.json is False:
             if request.is_json is True:
                 raise error.RequestValidationError(
                     "request should not contain a json body"
                 )
             return None
+        if isinstance(self.json, compiler.CompiledSchema) and request.is_json:
+            try:
+                data = json.loads(request.get_data())
+            except ValueError as ex:
+                raise BadRequest(f"invalid json body: {ex}")
+            except RecursionError:
+                raise BadRequest("invalid json body: too deeply nested")
+            return self.json.load(self.check_limits(data))
         if utils.is_instance_or_type(self.json, base.SchemaAttribute):
-            return self.json.load(request.json)
-        return request.json
+            return self.json.load(self.check_limits(request.json))
+        return self.check_limits(request.json)
+
+    def check_limits(self, data: Any) -> Any:
+        if self.limits is None:
+            return data
+        try:
+            return self.limits.check(data)
+        except error.PropertyValidationError as ex:
+            raise BadRequest(str(ex))
+
+    def check_body_size(self):
+        if self.max_body_size is None:
+            return
+        size = request.content_length
+        if size is None:
+            if self.stream:
+                return
+            size = len(request.get_data(cache=True))
+        if size > self.max_body_size:
+            raise RequestEntityTooLarge(
+                f"request body is larger than {self.max_body_size} bytes"
+            )
+
+    @staticmethod
+    def iter_json(items: Iterator[Any]) -> Iterator[Any]:
+        try:
+            yield from items
+        except ValueError as ex:
+            raise BadRequest(f"invalid json body: {ex}")
+        except error.PropertyValidationError as ex:
+            raise BadRequest(str(ex))
+        except BatchValidationError as ex:
+            raise BadRequest(ex.message)
 
     def __call__(self, func: Callable) -> Callable:
         func_info = inspect.signature(func)
@@ -112,16 +192,18 @@ class RequestSchema:
 
         @functools.wraps(func)
         def call(**kwargs: Any) -> Any:
+            self.check_body_size()
             for name, value in self.load_view_args().items():
                 kwargs[name] = value
             try:
-                kwargs = self.load(
-                    kwargs,
-                    func_params,
-                    json=self.load_json,
-                    query=self.load_query,
-                    form=self.load_form,
-                )
+                with context.fail_fast(self.max_errors):
+                    kwargs = self.load(
+                        kwargs,
+                        func_params,
+                        json=self.load_json,
+                        query=self.load_query,
+                        form=self.load_form,
+                    )
             except BatchValidationError as ex:
                 raise BadRequest(ex.message)
             return func(**kwargs)
@@ -0,0 +1,79 @@
+import codecs
+import json
+from typing import Any, BinaryIO, Iterator
+
+CHUNK_SIZE = 64 * 1024
+WHITESPACE = " \t\n\r"
+DELIMITERS = WHITESPACE + ",]}"
+
+
+class _Reader:
+    def __init__(self, stream: BinaryIO, chunk_size: int):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.decoder = codecs.getincrementaldecoder("utf8")()
+        self.buffer = ""
+        self.position = 0
+        self.eof = False
+
+    def read(self) -> bool:
+        if self.eof:
+            return False
+        if self.position > self.chunk_size:
+            self.buffer = self.buffer[self.position :]
+            self.position = 0
+        size = max(self.chunk_size, len(self.buffer) - self.position)
+        data = self.stream.read(size)
+        self.eof = not data
+        self.buffer += self.decoder.decode(data, final=self.eof)
+        return True
+
+    def peek(self) -> str:
+        while True:
+            while self.position < len(self.buffer):
+                if self.buffer[self.position] not in WHITESPACE:
+                    return self.buffer[self.position]
+                self.position += 1
+            if not self.read():
+                return ""
+
+    def expect(self, chars: str) -> str:
+        char = self.peek()
+        if not char or char not in chars:
+            self.error(f"expected one of {', '.join(repr(c) for c in chars)}")
+        self.position += 1
+        return char
+
+    def value(self, decoder: json.JSONDecoder) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError:
+                if not self.read():
+                    raise
+                continue
+            complete = end < len(self.buffer) and (
+                type(value) not in (int, float) or self.buffer[end] in DELIMITERS
+            )
+            if complete or not self.read():
+                self.position = end
+                return value
+
+    def error(self, message: str):
+        raise json.JSONDecodeError(message, self.buffer, self.position)
+
+
+def iter_json_array(stream: BinaryIO, chunk_size: int = CHUNK_SIZE) -> Iterator[Any]:
+    reader = _Reader(stream, chunk_size)
+    decoder = json.JSONDecoder()
+    reader.expect("[")
+    if reader.peek() == "]":
+        reader.position += 1
+    else:
+        while True:
+            yield reader.value(decoder)
+            if reader.expect(",]") == "]":
+                break
+    if reader.peek():
+        reader.error("extra data after json array")
@@ -0,0 +1,24 @@
+import timeit
+import uuid
+
+from jason import props
+
+NUMBER = 100000
+
+CASES = {
+    "uuid": (props.Uuid(), str(uuid.uuid4())),
+    "uuid (hex)": (props.Uuid(), uuid.uuid4().hex),
+    "email": (props.Email(), "someone@example.com"),
+    "regex": (props.Regex("[a-z]+-[0-9]+"), "abc-123"),
+    "password": (props.Password(score=3), "Sup3r-Secret-Passw0rd"),
+}
+
+
+def main():
+    for name, (prop, value) in CASES.items():
+        seconds = min(timeit.repeat(lambda: prop.load(value), number=NUMBER, repeat=5))
+        print(f"{name:<12} {seconds / NUMBER * 1e9:8.0f} ns/load")
+
+
+if __name__ == "__main__":
+    main()
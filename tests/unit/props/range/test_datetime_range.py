@@ -1,3 +1,5 @@
+import datetime
+
 import pytest
 
 from jason.props import PropertyValidationError
@@ -29,3 +31,10 @@ def test_raises_error_when_too_low(range):
 def test_raises_error_when_too_high(range):
     with pytest.raises(PropertyValidationError):
         range.validate("2010-01-01T00:00:00.000Z")
+
+
+def test_parses_static_bounds_once(range):
+    assert range.bounds() == (
+        datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc),
+        datetime.datetime(2000, 1, 1, tzinfo=datetime.timezone.utc),
+    )
@@ -1,6 +1,9 @@
+from unittest import mock
+
 import pytest
 
-from jason.props import PropertyValidationError
+from jason import props
+from jason.props import PropertyValidationError, context
 from jason.props.range import RangeCheck
 
 
@@ -21,3 +24,56 @@ def test_raises_error_when_too_low(range):
 def test_raises_error_when_too_high(range):
     with pytest.raises(PropertyValidationError):
         range.validate(15)
+
+
+def test_zero_bound():
+    with pytest.raises(PropertyValidationError):
+        RangeCheck(0, None).validate(-1)
+
+
+def test_static_bounds_resolved_once():
+    range = RangeCheck(5, 10)
+    range.mod_param = mock.Mock(side_effect=lambda param: param)
+    range.validate(7)
+    range.validate(8)
+    range.mod_param.assert_not_called()
+
+
+def test_callable_bounds_resolved_per_call():
+    bound = mock.Mock(return_value=5)
+    range = RangeCheck(bound, None)
+    range.validate(7)
+    range.validate(8)
+    assert bound.call_count == 2
+
+
+def test_callable_bounds_resolved_once_per_scope():
+    bound = mock.Mock(return_value=5)
+    range = RangeCheck(bound, None)
+    with context.load_scope():
+        range.validate(7)
+        range.validate(8)
+    assert bound.call_count == 1
+
+
+def test_callable_bounds_ttl():
+    bound = mock.Mock(return_value=5)
+    range = RangeCheck(bound, None, ttl=60)
+    range.validate(7)
+    range.validate(8)
+    assert bound.call_count == 1
+
+
+def test_callable_bounds_ttl_expires():
+    bound = mock.Mock(return_value=5)
+    range = RangeCheck(bound, None, ttl=60)
+    with mock.patch("time.monotonic", side_effect=[0, 0, 100, 100]):
+        range.validate(7)
+        range.validate(8)
+    assert bound.call_count == 2
+
+
+def test_array_resolves_bounds_once():
+    bound = mock.Mock(return_value=5)
+    props.Array(props.Int(min_value=bound)).load([6, "7", 8])
+    assert bound.call_count == 1
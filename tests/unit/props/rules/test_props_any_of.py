@@ -33,3 +33,53 @@ def test_fails(err):
 
 def test_accepts_type(err):
     props.AnyOf(mock.Mock, mock.Mock).load("thing")
+
+
+def test_instantiates_types_once():
+    rule = props.AnyOf(props.Int, props.String)
+    assert isinstance(rule.rules[0], props.Int)
+    assert rule.load("abc") == "abc"
+    assert rule.load(1) == 1
+
+
+def test_indexes_rules_by_type():
+    rule = props.AnyOf(props.Array(props.Int), props.Int(), props.String(), mock.Mock())
+    assert rule.candidates(list) == (0, 3)
+    assert rule.candidates(int) == (1, 3)
+    assert rule.candidates(str) == (1, 2, 3)
+
+
+def test_bool_is_not_int():
+    rule = props.AnyOf(props.Int(allow_strings=False), props.Bool())
+    assert rule.candidates(bool) == (1,)
+    assert rule.load(True) is True
+
+
+def test_number_accepts_strings():
+    rule = props.AnyOf(props.Number(types=(int,)), props.String())
+    assert rule.load("12") == 12
+
+
+def test_first_valid_rule():
+    assert props.AnyOf(props.String(), props.Int()).load("12") == "12"
+
+
+def test_none_tries_every_rule():
+    assert props.AnyOf(props.Int(), props.String(default="x")).load(None) == "x"
+
+
+def test_nested():
+    class First(props.Model):
+        x = props.Int()
+
+    class Second(props.Model):
+        y = props.Int()
+
+    rule = props.AnyOf(props.Nested(First), props.Nested(Second))
+    assert rule.load({"y": 1}) == {"y": 1}
+
+
+def test_reports_every_rule():
+    with pytest.raises(props.BatchValidationError) as ex:
+        props.AnyOf(props.Int(), props.Array(props.Int), props.String()).load(1.5)
+    assert ex.value.count == 3
@@ -0,0 +1,162 @@
+import pickle
+from unittest import mock
+
+import pytest
+
+from jason import props
+
+
+class Context(props.Model):
+    __cache__ = props.LRU(10)
+    client = props.String()
+    version = props.Int()
+
+
+def test_caches_valid_values():
+    prop = props.Int(cache=props.LRU())
+    assert prop.load("1") == 1
+    assert prop.load("1") == 1
+    assert prop.cache.info() == props.CacheInfo(1, 1, 0, 1, 128)
+
+
+def test_skips_validation_on_hit():
+    validate = mock.Mock(side_effect=lambda value: value)
+    prop = props.String(cache=props.LRU())(validate)
+    prop.load("a")
+    prop.load("a")
+    assert validate.call_count == 1
+
+
+def test_does_not_cache_errors():
+    prop = props.Int(min_value=2, cache=props.LRU())
+    for _ in range(2):
+        with pytest.raises(props.PropertyValidationError):
+            prop.load(1)
+    assert prop.cache.info().size == 0
+
+
+def test_keys_on_type():
+    prop = props.Property(cache=props.LRU())
+    assert type(prop.load(1)) is int
+    assert type(prop.load(True)) is bool
+    assert prop.load(1.0) == 1.0 and type(prop.load(1.0)) is float
+
+
+def test_keys_on_dict_key_type():
+    prop = props.Map(keys=props.Property(), cache=props.LRU())
+    for key in (1, True, 1.0):
+        loaded = prop.load({key: "v"})
+        assert type(next(iter(loaded))) is type(key)
+    assert prop.cache.info().size == 3
+
+
+def test_key_ignores_order():
+    prop = props.Nested(Context, cache=props.LRU())
+    prop.load({"client": "a", "version": 1})
+    prop.load({"version": 1, "client": "a"})
+    assert prop.cache.info().hits == 1
+
+
+def test_model_cache():
+    prop = props.Nested(Context)
+    assert prop.cache is Context.__cache__
+    assert props.Nested(Context).load({"client": "a", "version": "1"}) == {
+        "client": "a",
+        "version": 1,
+    }
+
+
+def test_shared_cache_is_keyed_per_property():
+    cache = props.LRU()
+    for min_value in range(20):
+        prop = props.Int(min_value=min_value, cache=cache)
+        if min_value > 5:
+            with pytest.raises(props.PropertyValidationError):
+                prop.load(5)
+        else:
+            assert prop.load(5) == 5
+
+
+@pytest.mark.parametrize("output", ["dict", "slots", "tuple"])
+def test_returns_copies(output):
+    class Filters(props.Model):
+        page = props.Int()
+        tags = props.Array(props.String)
+
+    prop = props.Nested(Filters, output=output, cache=props.LRU())
+    value = {"page": 1, "tags": ["x"]}
+    first = prop.load(value)
+    if output == "dict":
+        first["page"] = 999
+        first["tags"].append("INJECTED")
+    else:
+        first.tags.append("INJECTED")
+    second = prop.load(value)
+    assert prop.cache.info().hits == 1
+    assert second == prop.load(value)
+    assert (second["tags"] if output == "dict" else second.tags) == ["x"]
+
+
+def test_eviction():
+    prop = props.Int(cache=props.LRU(2))
+    for value in (1, 2, 1, 3, 1):
+        prop.load(value)
+    info = prop.cache.info()
+    assert (info.hits, info.misses, info.evictions, info.size) == (2, 3, 1, 2)
+
+
+def test_unhashable_values_are_not_cached():
+    prop = props.Property(cache=props.LRU())
+    value = object()
+    assert prop.load(value) is value
+    assert prop.cache.info().misses == 0
+
+
+@pytest.mark.parametrize(
+    "make, value",
+    [
+        (lambda cache: props.Int(default=lambda: 1, cache=cache), 1),
+        (lambda cache: props.Int(max_value=lambda: 10, cache=cache), 1),
+        (lambda cache: props.Choice(choices=lambda: ["a"], cache=cache), "a"),
+        (lambda cache: props.Array(props.Int(min_value=lambda: 0), cache=cache), [1]),
+        (
+            lambda cache: props.Inline(
+                props=dict(x=props.Int(default=lambda: 1)), cache=cache
+            ),
+            {"x": None},
+        ),
+    ],
+)
+def test_dynamic_schemas_are_not_cached(make, value):
+    cache = props.LRU()
+    prop = make(cache)
+    prop.load(value)
+    prop.load(value)
+    assert cache.info().size == 0
+
+
+def test_compiled():
+    prop = props.Nested(Context, cache=props.LRU())
+    compiled = props.compile(props.Array(prop))
+    compiled.load([{"client": "a", "version": 1}] * 3)
+    assert prop.cache.info().hits == 2
+
+
+def test_clear():
+    prop = props.Int(cache=props.LRU())
+    prop.load(1)
+    prop.cache.clear()
+    assert prop.cache.info() == props.CacheInfo(0, 0, 0, 0, 128)
+
+
+def test_pickle():
+    prop = props.Int(cache=props.LRU())
+    prop.load(1)
+    loaded = pickle.loads(pickle.dumps(prop))
+    assert loaded.load("2") == 2
+    assert loaded.cache.info().size == 1
+
+
+def test_invalid_maxsize():
+    with pytest.raises(ValueError):
+        props.LRU(0)
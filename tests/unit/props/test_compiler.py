@@ -0,0 +1,270 @@
+import datetime
+
+import pytest
+
+from jason import props
+
+
+class Child(props.Model):
+    name = props.String(min_length=1, max_length=5)
+    flag = props.Bool(default=False)
+
+
+class Parent(props.Model):
+    id = props.Int(min_value=1, max_value=100)
+    ratio = props.Float(nullable=True)
+    count = props.Number(default=lambda: 3)
+    kind = props.Choice(choices=["a", "b"])
+    anything = props.Property(nullable=True)
+    when = props.Datetime(nullable=True)
+    child = props.Nested(Child, nullable=True)
+    children = props.Array(props.Nested(Child), max_length=3, nullable=True)
+    tags = props.Array(props.String(max_length=3), nullable=True)
+
+
+def load(schema, value):
+    try:
+        return schema.load(value)
+    except (props.PropertyValidationError, props.BatchValidationError) as ex:
+        return type(ex), str(ex)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"id": 1, "kind": "a"},
+        {"id": "12", "ratio": 2, "kind": "b", "count": "2.5"},
+        {"id": 1, "kind": "a", "child": {"name": "abc", "flag": "true"}},
+        {"id": 1, "kind": "a", "children": [{"name": "x"}, {"name": "y"}]},
+        {"id": 1, "kind": "a", "tags": ("a", "bc")},
+        {"id": 1, "kind": "a", "when": "2019-01-01T00:00:00Z"},
+        {"id": 1, "kind": "a", "anything": object},
+        {"id": 0, "kind": "c"},
+        {"id": True, "kind": "a"},
+        {"id": 1.5, "kind": "a", "ratio": "nope"},
+        {"id": 1, "kind": "a", "extra": 1},
+        {"id": 1, "kind": "a", "child": {"name": ""}},
+        {"id": 1, "kind": "a", "children": [{"name": "x"}, {}, {"name": 1}]},
+        {"id": 1, "kind": "a", "children": [{}, {}, {}, {}]},
+        {"id": 1, "kind": "a", "tags": ["abcd", "a", 1]},
+        {"id": 1, "kind": "a", "child": "nope"},
+        None,
+        [],
+    ],
+)
+def test_matches_interpreted(value):
+    compiled = props.compile(Parent)
+    assert load(compiled, value) == load(compiled.schema, value)
+
+
+def test_compiles_property():
+    compiled = props.compile(props.Int(min_value=2))
+    assert compiled.load(3) == 3
+    with pytest.raises(props.PropertyValidationError):
+        compiled.load(1)
+
+
+def test_compiles_property_type():
+    assert props.compile(props.String).load("hello") == "hello"
+
+
+def test_compiles_inline():
+    compiled = props.compile(props.Inline(props=dict(x=props.Int, y=props.String)))
+    assert compiled.load({"x": 1, "y": "thing"}) == {"x": 1, "y": "thing"}
+
+
+def test_nullable():
+    assert props.compile(props.Nested(Child, nullable=True)).load(None) is None
+
+
+def test_not_nullable():
+    with pytest.raises(props.PropertyValidationError):
+        props.compile(Child).load(None)
+
+
+def test_default():
+    compiled = props.compile(props.Nested(Child, default={"name": "abc"}))
+    assert compiled.load(None) == {"name": "abc", "flag": False}
+
+
+def test_callable_bounds():
+    compiled = props.compile(props.Date(min_value=lambda: datetime.date(2019, 1, 1)))
+    assert compiled.load("2019-01-02") == datetime.date(2019, 1, 2)
+    with pytest.raises(props.PropertyValidationError):
+        compiled.load("2018-01-01")
+
+
+def test_uses_decorated_validator():
+    @props.Int()
+    def double(value):
+        return value * 2
+
+    compiled = props.compile(props.Inline(props=dict(x=double)))
+    assert compiled.load({"x": 2}) == {"x": 4}
+
+
+def test_uses_custom_property():
+    class Upper(props.String):
+        def _validate(self, value):
+            return value.upper()
+
+    compiled = props.compile(props.Inline(props=dict(x=Upper)))
+    assert compiled.load({"x": "abc"}) == {"x": "ABC"}
+
+
+def test_is_schema_attribute():
+    compiled = props.compile(Child)
+    assert props.Array(compiled).load([{"name": "abc"}]) == [
+        {"name": "abc", "flag": False}
+    ]
+
+
+@pytest.mark.parametrize("max_errors", [1, 2, 3, 50])
+def test_matches_interpreted_max_errors(max_errors):
+    compiled = props.compile(props.Nested(Parent, max_errors=max_errors))
+    value = {"id": 0, "kind": "c", "tags": ["abcd"] * 10, "extra": 1}
+    assert load(compiled, value) == load(compiled.schema, value)
+    with props.fail_fast(max_errors):
+        assert load(props.compile(Parent), value) == load(compiled.schema, value)
+
+
+@pytest.mark.parametrize(
+    "value", [[1, 2, 3], [1, "2", 3], [1, 11, 0], [True], [], None, "nope"]
+)
+def test_matches_interpreted_batch(value):
+    compiled = props.compile(props.Array(props.Int(min_value=1, max_value=10)))
+    assert load(compiled, value) == load(compiled.schema, value)
+
+
+def test_array_output():
+    compiled = props.compile(props.Array(props.Int(), output="array"))
+    assert compiled.load([1, "2"]).tolist() == [1, 2]
+
+
+@pytest.mark.parametrize("output", ["slots", "tuple"])
+def test_record_output(output):
+    compiled = props.compile(props.Nested(Child, output=output))
+    value = {"name": "abc"}
+    assert compiled.load(value) == compiled.schema.load(value)
+    assert compiled.load(value).name == "abc"
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"kind": "child", "name": "abc"},
+        {"kind": "child", "name": ""},
+        {"kind": "parent", "id": 1, "children": [{"name": "x"}]},
+        {"kind": "other"},
+        {"kind": ["child"]},
+        {},
+        "child",
+        None,
+    ],
+)
+def test_matches_interpreted_one_of(value):
+    compiled = props.compile(
+        props.OneOf(
+            "kind",
+            {
+                "child": props.Nested(Child, strict=False),
+                "parent": props.Nested(Parent, strict=False),
+            },
+        )
+    )
+    assert load(compiled, value) == load(compiled.schema, value)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2019-06-01T10:00:00Z",
+        "2019-06-01T10:00:00",
+        datetime.datetime(2019, 6, 1),
+        datetime.date(2019, 6, 1),
+        "2018-01-01T00:00:00Z",
+        "2019-06-01",
+        "nope",
+        1,
+    ],
+)
+def test_matches_interpreted_datetime(value):
+    compiled = props.compile(props.Datetime(min_value="2019-01-01T00:00:00Z"))
+    assert load(compiled, value) == load(compiled.schema, value)
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["2019-06-01", datetime.date(2019, 6, 1), "2018-01-01", "2020-01-01", "nope", 1],
+)
+def test_matches_interpreted_date(value):
+    compiled = props.compile(props.Date(min_value="2019-01-01", max_value="2019-12-31"))
+    assert load(compiled, value) == load(compiled.schema, value)
+
+
+def test_loads():
+    compiled = props.compile(props.Inline(props=dict(day=props.Date)))
+    assert compiled.loads(b'{"day": "2019-01-01"}') == {
+        "day": datetime.date(2019, 1, 1)
+    }
+
+
+@pytest.mark.parametrize(
+    "prop",
+    [
+        props.Uuid(),
+        props.Email(max_length=20),
+        props.Regex("[a-z]+", min_length=lambda: 2),
+    ],
+)
+@pytest.mark.parametrize(
+    "value",
+    [
+        "0f8fad5b-d9cb-469f-a165-70867728950e",
+        "0f8fad5bd9cb469fa16570867728950e",
+        "someone@example.com",
+        "someone.with.a.long.name@example.com",
+        "a",
+        "abc",
+        "123",
+        1,
+    ],
+)
+def test_matches_interpreted_formats(prop, value):
+    compiled = props.compile(prop)
+    assert load(compiled, value) == load(compiled.schema, value)
+
+
+@pytest.mark.parametrize("value", ["a", "c", 1, True, 2.0, [1], {"a": 1}])
+def test_matches_interpreted_choice(value):
+    for prop in (
+        props.Choice(choices=["a", "b", 1, 2, [1]]),
+        props.Choice(choices=lambda: ["a"]),
+    ):
+        compiled = props.compile(prop)
+        assert load(compiled, value) == load(compiled.schema, value)
+
+
+@pytest.mark.parametrize(
+    "value", [[1, 2, 3], [1, 2, 1], [{"name": "a"}, {"name": "a"}], ["1", 1]]
+)
+def test_matches_interpreted_unique(value):
+    for prop in (
+        props.Array(props.Int, unique=True),
+        props.Array(props.Nested(Child), unique_by="name"),
+    ):
+        compiled = props.compile(prop)
+        assert load(compiled, value) == load(compiled.schema, value)
+
+
+@pytest.mark.parametrize("value", [" abc ", " abcdefgh ", 1, None])
+def test_matches_interpreted_decorated(value):
+    prop = props.String(max_length=6, nullable=True)(str.strip)(str.upper)
+    compiled = props.compile(props.Inline(props=dict(x=prop)))
+    assert load(compiled, {"x": value}) == load(compiled.schema, {"x": value})
+
+
+def test_inlines_decorated():
+    prop = props.String(max_length=6)(str.strip)
+    compiled = props.compile(props.Inline(props=dict(x=prop)))
+    assert "type(" in compiled.source
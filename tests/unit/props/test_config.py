@@ -2,7 +2,7 @@ from unittest import mock
 
 import pytest
 
-from jason.props import BatchValidationError, Int, config
+from jason.props import BatchValidationError, Int, config, context
 
 
 @pytest.fixture
@@ -60,3 +60,29 @@ def test_indexer_set(config_obj):
 def test_contains(config_obj):
     obj = config_obj.load()
     assert "MY_INT" in obj
+
+
+def test_max_errors():
+    class MyConfig(config.ConfigObject):
+        __max_errors__ = 1
+        A = Int()
+        B = Int()
+
+    with pytest.raises(BatchValidationError) as ex:
+        MyConfig.load()
+    assert ex.value.count == 1
+    assert ex.value.truncated
+
+
+def test_max_errors_uses_smallest_cap():
+    class MyConfig(config.ConfigObject):
+        __max_errors__ = 5
+        A = Int()
+        B = Int()
+        C = Int()
+
+    with pytest.raises(BatchValidationError) as ex:
+        with context.fail_fast(1):
+            MyConfig.load()
+    assert ex.value.count == 1
+    assert ex.value.truncated
@@ -0,0 +1,94 @@
+import pytest
+
+from jason import props
+
+
+class Child(props.Model):
+    name = props.String(max_length=5)
+    count = props.Int()
+
+
+class Parent(props.Model):
+    children = props.Array(props.Nested(Child), max_length=3)
+    tags = props.Map(keys=props.String(max_length=4), values=props.Bool, max_size=2)
+    kind = props.Choice(["a", "bb"])
+
+
+def test_derives_limits():
+    limits = props.Limits.from_schema(Parent)
+    assert limits.max_depth == 3
+    assert limits.max_nodes == 1 + (1 + 3 * 3) + (1 + 2) + 1
+    assert limits.max_string_length == props.limits.SCALAR_LENGTH
+    assert limits.max_array_length == 3
+
+
+def test_derived_limits_accept_valid_payloads():
+    value = {
+        "children": [{"name": "abcde", "count": "12"}] * 3,
+        "tags": {"abcd": True, "b": False},
+        "kind": "bb",
+    }
+    props.Nested(Parent).load(props.Limits.from_schema(Parent).check(value))
+
+
+def test_string_length():
+    limits = props.Limits.from_schema(props.Array(props.String(max_length=3)))
+    assert limits.max_string_length == 3
+    with pytest.raises(props.PropertyValidationError):
+        limits.check(["abcd"])
+
+
+def test_unbounded():
+    limits = props.Limits.from_schema(props.Array(props.Property()))
+    assert limits.max_depth is None
+    assert limits.max_nodes is None
+    limits.check([[[["x" * 1000]]]])
+
+
+def test_not_strict_is_unbounded():
+    limits = props.Limits.from_schema(props.Nested(Child, strict=False))
+    assert limits.max_depth is None
+
+
+def test_callable_bounds_are_unbounded():
+    limits = props.Limits.from_schema(props.Array(props.Int, max_length=lambda: 3))
+    assert limits.max_array_length is None
+    assert limits.max_nodes is None
+    assert limits.max_depth == 1
+
+
+def test_overrides():
+    limits = props.Limits.from_schema(props.Array(props.Property()), max_depth=2)
+    assert limits.max_depth == 2
+
+
+def test_compiled_schema():
+    limits = props.Limits.from_schema(props.compile(Parent))
+    assert limits.max_depth == 3
+
+
+def test_max_depth():
+    with pytest.raises(props.PropertyValidationError):
+        props.Limits(max_depth=2).check({"a": [[1]]})
+    props.Limits(max_depth=2).check({"a": [1]})
+
+
+def test_max_nodes():
+    with pytest.raises(props.PropertyValidationError):
+        props.Limits(max_nodes=3).check([1, 2, 3])
+    props.Limits(max_nodes=4).check([1, 2, 3])
+
+
+def test_max_array_length():
+    with pytest.raises(props.PropertyValidationError):
+        props.Limits(max_array_length=2).check({"a": [1, 2, 3]})
+
+
+def test_key_length():
+    with pytest.raises(props.PropertyValidationError):
+        props.Limits(max_string_length=2).check({"abc": 1})
+
+
+def test_returns_value():
+    value = {"a": [1, "b"]}
+    assert props.Limits().check(value) is value
@@ -0,0 +1,85 @@
+import pytest
+
+from jason import props
+
+
+class Row(props.Model):
+    id = props.Int(min_value=1)
+    name = props.String()
+
+
+def rows(count):
+    return [{"id": i + 1, "name": str(i)} for i in range(count)]
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_matches_array(compiled):
+    items = rows(25)
+    assert props.parallel_load(
+        Row, items, workers=2, chunk_size=4, compiled=compiled
+    ) == props.Array(props.Nested(Row)).load(items)
+
+
+def test_in_process():
+    assert props.parallel_load(props.Int, [1, "2"], workers=2) == [1, 2]
+
+
+def test_errors_in_order():
+    items = rows(25)
+    items[3]["id"] = 0
+    items[20]["name"] = 1
+    with pytest.raises(props.BatchValidationError) as ex:
+        props.parallel_load(Row, items, workers=2, chunk_size=4)
+    assert [path for path, _ in ex.value.flatten()] == [(3, "id"), (20, "name")]
+
+
+def test_max_errors():
+    items = [{"id": 0, "name": "x"}] * 25
+    with pytest.raises(props.BatchValidationError) as ex:
+        props.parallel_load(
+            props.Array(props.Nested(Row), max_errors=2), items, workers=2, chunk_size=4
+        )
+    assert ex.value.truncated
+    assert ex.value.count == 2
+
+
+def test_array_range():
+    with pytest.raises(props.PropertyValidationError):
+        props.parallel_load(
+            props.Array(props.Int, max_length=3), [1] * 10, workers=2, chunk_size=2
+        )
+
+
+def test_array_output():
+    loaded = props.parallel_load(
+        props.Array(props.Int, output="array"), list(range(10)), workers=2, chunk_size=2
+    )
+    assert loaded.tolist() == list(range(10))
+
+
+def test_records():
+    items = rows(10)
+    loaded = props.parallel_load(
+        props.Nested(Row, output="slots"), items, workers=2, chunk_size=3
+    )
+    assert [row.id for row in loaded] == list(range(1, 11))
+
+
+def test_unique_across_chunks():
+    schema = props.Array(props.Int, unique=True)
+    with pytest.raises(props.BatchValidationError) as ex:
+        props.parallel_load(schema, [1, 2, 3, 1, 2, 3], workers=2, chunk_size=2)
+    assert [index for index, _ in ex.value.errors] == [3, 4, 5]
+
+
+def test_unique_by_across_chunks():
+    schema = props.Array(props.Nested(Row), unique_by="id")
+    items = rows(6) + rows(1)
+    with pytest.raises(props.BatchValidationError):
+        props.parallel_load(schema, items, workers=2, chunk_size=2)
+
+
+def test_set():
+    assert props.parallel_load(
+        props.Set(props.Int), [4, 2, "3", 1], workers=2, chunk_size=2
+    ) == {1, 2, 3, 4}
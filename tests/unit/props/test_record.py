@@ -0,0 +1,63 @@
+import pickle
+
+import pytest
+
+from jason.props import record
+
+
+def test_dict():
+    assert record.record_type("Thing", ("x", "y"), "dict") is None
+
+
+def test_invalid_output():
+    with pytest.raises(ValueError):
+        record.record_type("Thing", ("x", "y"), "nope")
+
+
+@pytest.mark.parametrize("output", ["slots", "tuple"])
+def test_record(output):
+    thing = record.record_type("Thing", ("x", "y"), output)(1, "a")
+    assert thing.x == 1
+    assert thing.y == "a"
+    assert thing._asdict() == {"x": 1, "y": "a"}
+    assert repr(thing) == "Thing(x=1, y='a')"
+
+
+@pytest.mark.parametrize("output", ["slots", "tuple"])
+def test_reuses_type(output):
+    assert record.record_type("Thing", ("x",), output) is record.record_type(
+        "Thing", ("x",), output
+    )
+
+
+@pytest.mark.parametrize("output", ["slots", "tuple"])
+def test_pickle(output):
+    thing = record.record_type("Thing", ("x", "y"), output)(1, "a")
+    assert pickle.loads(pickle.dumps(thing)) == thing
+
+
+def test_slots():
+    thing = record.record_type("Thing", ("x",), "slots")(1)
+    assert not hasattr(thing, "__dict__")
+    with pytest.raises(AttributeError):
+        thing.z = 1
+
+
+def test_equality():
+    thing_type = record.record_type("Thing", ("x",), "slots")
+    assert thing_type(1) == thing_type(1)
+    assert thing_type(1) != thing_type(2)
+
+
+@pytest.mark.parametrize("field", ["not valid", "class", "_private"])
+def test_invalid_field(field):
+    with pytest.raises(ValueError):
+        record.record_type("Thing", (field,), "slots")
+
+
+@pytest.mark.parametrize("output", ["slots", "tuple"])
+def test_pickle_by_reference(output):
+    thing = record.record_type("Thing", ("x", "y"), output)(1, "a")
+    dumped = pickle.dumps(thing)
+    record._record_types.clear()
+    assert pickle.loads(dumped)._asdict() == {"x": 1, "y": "a"}
@@ -63,3 +63,216 @@ def test_default():
     mock_prop = mock.Mock()
     mock_prop.load.side_effect = lambda x: x
     assert props.Array(mock_prop, default=[1, 2, 3, 4]).load(None) == [1, 2, 3, 4]
+
+
+def test_error_paths():
+    with pytest.raises(props.BatchValidationError) as ex:
+        props.Array(props.Int).load([1, "a", 3, None])
+    assert [path for path, _ in ex.value.flatten()] == [(1,), (3,)]
+
+
+def test_max_errors(err):
+    with pytest.raises(props.BatchValidationError) as ex:
+        props.Array(err, max_errors=2).load([1, 2, 3, 4])
+    assert ex.value.count == 2
+    assert ex.value.truncated
+    assert err.load.call_count == 2
+
+
+def test_fail_fast(err):
+    with pytest.raises(props.BatchValidationError) as ex:
+        props.Array(err, fail_fast=True).load([1, 2, 3, 4])
+    assert ex.value.count == 1
+    assert err.load.call_count == 1
+
+
+def test_fail_fast_per_call(err):
+    with props.fail_fast(max_errors=3), pytest.raises(props.BatchValidationError) as ex:
+        props.Array(err).load([1, 2, 3, 4])
+    assert ex.value.count == 3
+    assert ex.value.truncated
+
+
+def test_not_truncated(err):
+    with pytest.raises(props.BatchValidationError) as ex:
+        props.Array(err, max_errors=10).load([1, 2, 3, 4])
+    assert ex.value.count == 4
+    assert not ex.value.truncated
+
+
+def test_batch_ints():
+    assert props.Array(props.Int(min_value=1, max_value=10)).load((1, 5, 10)) == [
+        1,
+        5,
+        10,
+    ]
+
+
+def test_batch_floats():
+    validated = props.Array(props.Float(max_value=2)).load([1, 1.5])
+    assert validated == [1.0, 1.5]
+    assert type(validated[0]) is float
+
+
+def test_batch_strings():
+    assert props.Array(props.String(max_length=3)).load(["a", "abc"]) == ["a", "abc"]
+
+
+def test_batch_falls_back_to_items():
+    prop = props.Array(props.Int(min_value=1, max_value=10))
+    assert prop.load([1, "2", 3]) == [1, 2, 3]
+    with pytest.raises(props.BatchValidationError) as ex:
+        prop.load([1, 11, 3, 0])
+    assert [path for path, _ in ex.value.flatten()] == [(1,), (3,)]
+
+
+def test_batch_falls_back_on_nan():
+    with pytest.raises(props.BatchValidationError):
+        props.Array(props.Float(min_value=1)).load([float("nan"), -1.0])
+
+
+def test_batch_skips_decorated_props():
+    @props.Int()
+    def double(value):
+        return value * 2
+
+    assert props.Array(double).load([1, 2]) == [2, 4]
+
+
+def test_array_output():
+    validated = props.Array(props.Int(max_value=10), output="array").load([1, 2])
+    assert validated.typecode == "q"
+    assert validated.tolist() == [1, 2]
+
+
+def test_array_output_from_items():
+    validated = props.Array(props.Float(), output="array").load(["1.5", 2])
+    assert validated.tolist() == [1.5, 2.0]
+
+
+def test_numpy_output():
+    numpy = pytest.importorskip("numpy")
+    prop = props.Array(props.Int(min_value=1, max_value=10), output="numpy")
+    validated = prop.load([1, 2, 10])
+    assert isinstance(validated, numpy.ndarray)
+    assert validated.tolist() == [1, 2, 10]
+    with pytest.raises(props.BatchValidationError):
+        prop.load([1, 2, 11])
+
+
+def test_invalid_output():
+    with pytest.raises(ValueError):
+        props.Array(props.Int(), output="nope")
+
+
+def test_unsupported_output():
+    with pytest.raises(ValueError):
+        props.Array(props.String(), output="array")
+
+
+def test_stream():
+    items = props.Array(props.Int).stream(iter([1, "2", 3]))
+    assert next(items) == 1
+    assert list(items) == [2, 3]
+
+
+def test_stream_errors():
+    items = props.Array(props.Int).stream(iter([1, "a", 3, None]))
+    assert next(items) == 1
+    with pytest.raises(props.BatchValidationError) as ex:
+        next(items)
+    assert [path for path, _ in ex.value.flatten()] == [(1,), (3,)]
+
+
+def test_stream_max_errors():
+    items = props.Array(props.Int).stream(iter(["a"] * 10), max_errors=2)
+    with pytest.raises(props.BatchValidationError) as ex:
+        list(items)
+    assert ex.value.count == 2
+    assert ex.value.truncated
+
+
+def test_stream_too_long():
+    items = props.Array(props.Int, max_length=2).stream(iter([1, 2, 3]))
+    with pytest.raises(props.PropertyValidationError):
+        list(items)
+
+
+def test_stream_too_short():
+    items = props.Array(props.Int, min_length=2).stream(iter([1]))
+    with pytest.raises(props.PropertyValidationError):
+        list(items)
+
+
+class Item(props.Model):
+    id = props.Int()
+    name = props.String(nullable=True)
+
+
+@pytest.mark.parametrize(
+    "prop", [props.Int, props.Property, props.String(min_length=1)]
+)
+def test_unique(prop):
+    assert props.Array(prop, unique=True).load(["1", "2"]) in (["1", "2"], [1, 2])
+    with pytest.raises(props.BatchValidationError) as ex:
+        props.Array(prop, unique=True).load(["1", "2", "1", "3", "2"])
+    assert [path for path, _ in ex.value.flatten()] == [(2,), (4,)]
+
+
+def test_unique_unhashable():
+    with pytest.raises(props.BatchValidationError) as ex:
+        props.Array(props.Property(), unique=True).load([[1], [2], [1]])
+    assert [path for path, _ in ex.value.flatten()] == [(2,)]
+
+
+def test_unique_max_errors():
+    with pytest.raises(props.BatchValidationError) as ex:
+        props.Array(props.Int, unique=True, max_errors=1).load([1, 1, 1])
+    assert ex.value.truncated
+
+
+@pytest.mark.parametrize("output", ["dict", "slots", "tuple"])
+def test_unique_by(output):
+    prop = props.Array(props.Nested(Item, output=output), unique_by="id")
+    assert len(prop.load([{"id": 1}, {"id": 2, "name": "x"}])) == 2
+    with pytest.raises(props.BatchValidationError) as ex:
+        prop.load([{"id": 1}, {"id": 2}, {"id": 1, "name": "x"}])
+    assert [path for path, _ in ex.value.flatten()] == [(2,)]
+
+
+@pytest.mark.parametrize("output", ["dict", "slots", "tuple"])
+def test_unique_large_nested(output):
+    prop = props.Array(props.Nested(Item, output=output), unique=True)
+    items = [{"id": i, "name": str(i)} for i in range(20000)]
+    assert len(prop.load(items)) == 20000
+    with pytest.raises(props.BatchValidationError) as ex:
+        prop.load(items + [{"id": 5, "name": "5"}])
+    assert [path for path, _ in ex.value.flatten()] == [(20000,)]
+
+
+def test_unique_by_is_identical():
+    prop = props.Array(props.Nested(Item), unique_by="id")
+    assert prop.is_identical_to(props.Array(props.Nested(Item), unique_by="id"))
+
+
+def test_unique_by_callable():
+    prop = props.Array(props.String, unique_by=str.lower)
+    with pytest.raises(props.BatchValidationError):
+        prop.load(["a", "A"])
+
+
+def test_unique_stream():
+    with pytest.raises(props.BatchValidationError) as ex:
+        list(props.Array(props.Int, unique=True).stream(iter([1, 2, 1])))
+    assert [path for path, _ in ex.value.flatten()] == [(2,)]
+
+
+def test_set():
+    assert props.Set(props.Int).load([1, "2"]) == {1, 2}
+    with pytest.raises(props.BatchValidationError):
+        props.Set(props.Int).load([1, 1])
+
+
+def test_set_unhashable():
+    with pytest.raises(props.PropertyValidationError):
+        props.Set(props.Nested(Item)).load([{"id": 1}])
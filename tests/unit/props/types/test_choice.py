@@ -1,3 +1,6 @@
+import enum
+from unittest import mock
+
 import pytest
 
 from jason import props
@@ -23,3 +26,61 @@ def test_not_nullable():
 
 def test_default():
     assert props.Choice(choices=[1, 2, 3], default=2).load(None) == 2
+
+
+def test_no_choices():
+    assert props.Choice().load("anything") == "anything"
+
+
+def test_unhashable_choices():
+    prop = props.Choice(choices=[1, [2, 3], {"a": 1}])
+    assert prop.load([2, 3]) == [2, 3]
+    assert prop.load({"a": 1}) == {"a": 1}
+    assert prop.load(1) == 1
+    with pytest.raises(props.PropertyValidationError):
+        prop.load([4])
+
+
+def test_unhashable_value():
+    with pytest.raises(props.PropertyValidationError):
+        props.Choice(choices=[1, 2, 3]).load([1])
+
+
+def test_lazy_choices():
+    choices = mock.Mock(return_value=["a", "b"])
+    prop = props.Choice(choices=choices)
+    choices.assert_not_called()
+    assert prop.load("a") == "a"
+    assert prop.load("b") == "b"
+    assert choices.call_count == 1
+
+
+def test_enum_choices():
+    class Colour(enum.Enum):
+        red = 1
+        blue = 2
+
+    assert props.Choice(choices=Colour).load(Colour.red) is Colour.red
+
+
+def test_from_file(tmp_path):
+    path = tmp_path / "choices.txt"
+    path.write_text("GB\nFR\n\nDE\n")
+    prop = props.Choice.from_file(str(path))
+    assert prop.load("DE") == "DE"
+    with pytest.raises(props.PropertyValidationError):
+        prop.load("US")
+
+
+def test_error_sample():
+    with pytest.raises(props.PropertyValidationError) as ex:
+        props.Choice(choices=range(1000), error_sample=3).load(-1)
+    assert (
+        str(ex.value) == "Property was expected to be one of: 0, 1, 2, ... (997 more)"
+    )
+
+
+def test_error_lists_small_choices():
+    with pytest.raises(props.PropertyValidationError) as ex:
+        props.Choice(choices=["a", "b"]).load("c")
+    assert str(ex.value) == "Property was expected to be one of: a, b"
@@ -1,3 +1,5 @@
+from unittest import mock
+
 import pytest
 
 from jason import props
@@ -69,6 +71,35 @@ def test_write_identical_items():
     props.Compound(ModelA, ModelB)
 
 
+def test_write_identical_unique_by_arrays():
+    class Item(props.Model):
+        id = props.Int()
+
+    class ModelA(props.Model):
+        items = props.Array(props.Nested(Item), unique_by="id")
+
+    class ModelB(props.Model):
+        items = props.Array(props.Nested(Item), unique_by="id")
+
+    assert list(props.Compound(ModelA, ModelB).__props__) == ["items"]
+
+
+def test_merge_skips_shared_schemas():
+    Big = type("Big", (props.Model,), {f"field_{i}": props.Int() for i in range(100)})
+
+    class ModelA(props.Model):
+        items = props.Array(props.Nested(Big))
+
+    class ModelB(props.Model):
+        items = props.Array(props.Nested(Big))
+
+    with mock.patch.object(
+        props.utils, "equivalent", wraps=props.utils.equivalent
+    ) as equivalent:
+        assert list(props.Compound(ModelA, ModelB).__props__) == ["items"]
+    assert equivalent.call_count < 100
+
+
 def test_fails_to_write_non_identical_items():
     class ModelA(props.Model):
         x = props.Int(min_value=5, max_value=10)
@@ -42,3 +42,10 @@ def test_wrong_type():
 
 def test_default():
     assert props.Date(default="1970-01-01").load(None).isoformat()
+
+
+def test_string_bounds():
+    prop = props.Date(min_value="2019-01-01", max_value="2019-12-31")
+    assert prop.load("2019-06-01") == datetime.date(2019, 6, 1)
+    with pytest.raises(props.PropertyValidationError):
+        prop.load("2020-01-01")
@@ -21,3 +21,10 @@ def test_default():
     assert props.Inline(props={"x": props.Int}, default={"x": 123}).load(None) == {
         "x": 123
     }
+
+
+def test_load_many_columnar():
+    prop = props.Inline(props={"x": props.Int, "y": props.String})
+    assert prop.load_many(
+        [{"x": 1, "y": "a"}, {"x": "2", "y": "b"}], columnar=True
+    ) == {"x": [1, 2], "y": ["a", "b"]}
@@ -0,0 +1,82 @@
+import pytest
+
+from jason import props
+
+
+class Thing(props.Model):
+    id = props.Int()
+
+
+def test_validates():
+    assert props.Map(keys=props.String, values=props.Int).load({"a": "1"}) == {"a": 1}
+
+
+def test_any_keys_and_values():
+    assert props.Map().load({"a": [1], 2: None}) == {"a": [1], 2: None}
+
+
+def test_model_values():
+    assert props.Map(values=Thing).load({"a": {"id": 1}}) == {"a": {"id": 1}}
+
+
+def test_loads_keys():
+    assert props.Map(keys=props.Int).load({"1": "a"}) == {1: "a"}
+
+
+def test_batch():
+    value = {str(i): float(i) for i in range(100)}
+    assert props.Map(keys=props.String, values=props.Float).load(value) == value
+
+
+def test_invalid_key():
+    with pytest.raises(props.BatchValidationError) as ex:
+        props.Map(keys=props.String(max_length=2)).load({"abc": 1, "a": 2})
+    assert [key for key, _ in ex.value.errors] == ["abc"]
+    assert "Map key is invalid" in str(ex.value)
+
+
+def test_invalid_value():
+    with pytest.raises(props.BatchValidationError) as ex:
+        props.Map(values=props.Int).load({"a": 1, "b": "x", "c": "y"})
+    assert [key for key, _ in ex.value.errors] == ["b", "c"]
+
+
+def test_nested_errors():
+    with pytest.raises(props.BatchValidationError) as ex:
+        props.Map(values=Thing).load({"a": {"id": "x"}})
+    assert [path for path, _ in ex.value.flatten()] == [("a", "id")]
+
+
+def test_too_small():
+    with pytest.raises(props.PropertyValidationError):
+        props.Map(min_size=2).load({"a": 1})
+
+
+def test_too_large():
+    with pytest.raises(props.PropertyValidationError):
+        props.Map(max_size=1).load({"a": 1, "b": 2})
+
+
+def test_size_checked_before_items():
+    with pytest.raises(props.PropertyValidationError):
+        props.Map(values=props.Int, max_size=1).load({"a": "x", "b": "y"})
+
+
+def test_callable_size():
+    props.Map(max_size=lambda: 2).load({"a": 1, "b": 2})
+
+
+def test_fail_fast():
+    with pytest.raises(props.BatchValidationError) as ex:
+        props.Map(values=props.Int, fail_fast=True).load({"a": "x", "b": "y"})
+    assert ex.value.truncated
+    assert len(ex.value.errors) == 1
+
+
+def test_nullable():
+    assert props.Map(nullable=True).load(None) is None
+
+
+def test_wrong_type():
+    with pytest.raises(props.PropertyValidationError):
+        props.Map().load([1, 2])
@@ -1,3 +1,5 @@
+import pytest
+
 from jason import props
 
 
@@ -15,3 +17,104 @@ def test_ignored_underscore_prefixed():
         _y = props.Int()
 
     assert MyModel.__props__ == {"x": MyModel.x}
+
+
+class Reading(props.Model):
+    sensor = props.String()
+    value = props.Float(min_value=-10)
+    count = props.Int(nullable=True)
+
+
+def test_load_many():
+    assert Reading.load_many([{"sensor": "a", "value": 1}]) == [
+        {"sensor": "a", "value": 1.0, "count": None}
+    ]
+
+
+def test_load_many_columnar():
+    columns = Reading.load_many(
+        [{"sensor": "a", "value": 1}, {"sensor": "b", "value": "2.5", "count": 3}],
+        columnar=True,
+    )
+    assert columns == {"sensor": ["a", "b"], "value": [1.0, 2.5], "count": [None, 3]}
+
+
+def test_load_many_columnar_array():
+    columns = Reading.load_many(
+        [{"sensor": "a", "value": 1}, {"sensor": "b", "value": 2}],
+        columnar=True,
+        output="array",
+    )
+    assert columns["value"].typecode == "d"
+    assert columns["value"].tolist() == [1.0, 2.0]
+    assert columns["count"] == [None, None]
+
+
+def test_load_many_columnar_numpy():
+    pytest.importorskip("numpy")
+    columns = Reading.load_many(
+        [{"sensor": "a", "value": 1}], columnar=True, output="numpy"
+    )
+    assert columns["value"].dtype.name == "float64"
+
+
+def test_load_many_columnar_errors_by_row():
+    with pytest.raises(props.BatchValidationError) as ex:
+        Reading.load_many(
+            [{"sensor": "a", "value": 1}, None, {"sensor": 1, "value": -11, "x": 1}],
+            columnar=True,
+        )
+    assert [path for path, _ in ex.value.flatten()] == [
+        (1,),
+        (2, "sensor"),
+        (2, "value"),
+        (2,),
+    ]
+
+
+def test_load_many_columnar_fail_fast():
+    with pytest.raises(props.BatchValidationError) as ex:
+        with props.fail_fast():
+            Reading.load_many([{"value": "a"}, {"value": "b"}], columnar=True)
+    assert ex.value.truncated
+
+
+@pytest.mark.parametrize("output", ["array", "numpy"])
+def test_load_many_columnar_overflow_by_row(output):
+    if output == "numpy":
+        pytest.importorskip("numpy")
+
+    class Counter(props.Model):
+        count = props.Int()
+
+    with pytest.raises(props.BatchValidationError) as ex:
+        Counter.load_many(
+            [{"count": 1}, {"count": 2 ** 70}, {"count": 3}],
+            columnar=True,
+            output=output,
+        )
+    assert [path for path, _ in ex.value.flatten()] == [(1, "count")]
+
+
+def test_load_many_columnar_max_errors_across_columns():
+    with pytest.raises(props.BatchValidationError) as ex:
+        with props.fail_fast(3):
+            Reading.load_many(
+                [{"sensor": 1, "value": "a"}, {"sensor": 2, "value": "b"}] * 2,
+                columnar=True,
+            )
+    assert ex.value.truncated
+    assert len(ex.value.flatten()) == 3
+
+
+def test_load_many_columnar_max_errors_type_errors():
+    with pytest.raises(props.BatchValidationError) as ex:
+        with props.fail_fast(2):
+            Reading.load_many([None] * 10, columnar=True)
+    assert ex.value.truncated
+    assert len(ex.value.flatten()) == 2
+
+
+def test_load_many_invalid_output():
+    with pytest.raises(ValueError):
+        Reading.load_many([], columnar=True, output="nope")
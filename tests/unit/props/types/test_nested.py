@@ -28,3 +28,140 @@ def test_default():
 def test_collects_errors():
     with pytest.raises(props.BatchValidationError):
         props.Nested(MyModel).load({"y": "nope"})
+
+
+def test_error_paths():
+    with pytest.raises(props.BatchValidationError) as ex:
+        props.Nested(MyModel).load({"x": "nope", "y": 1})
+    assert [path for path, _ in ex.value.flatten()] == [("x",), ()]
+
+
+class LimitedModel(props.Model):
+    __max_errors__ = 2
+    a = props.Int
+    b = props.Int
+    c = props.Int
+    items = props.Array(props.Int)
+
+
+def test_model_max_errors():
+    with pytest.raises(props.BatchValidationError) as ex:
+        props.Nested(LimitedModel).load({})
+    assert ex.value.count == 2
+    assert ex.value.truncated
+
+
+def test_max_errors_limits_children():
+    with pytest.raises(props.BatchValidationError) as ex:
+        props.Nested(LimitedModel, max_errors=5).load(
+            {"a": 1, "b": 1, "c": 1, "items": ["x"] * 100}
+        )
+    assert ex.value.count == 5
+    assert ex.value.truncated
+
+
+def test_fail_fast():
+    with pytest.raises(props.BatchValidationError) as ex:
+        props.Nested(LimitedModel, fail_fast=True).load({})
+    assert ex.value.count == 1
+
+
+@pytest.mark.parametrize("output", ["slots", "tuple"])
+def test_record_output(output):
+    validated = props.Nested(MyModel, output=output).load({"x": "12"})
+    assert validated.x == 12
+    assert validated._asdict() == {"x": 12}
+
+
+def test_tuple_fields_are_alphabetical():
+    class User(props.Model):
+        name = props.String()
+        age = props.Int()
+
+    loaded = props.Nested(User, output="tuple").load({"name": "a", "age": 1})
+    assert tuple(loaded) == (1, "a")
+    assert loaded._fields == ("age", "name")
+
+
+def test_model_output():
+    class RecordModel(props.Model):
+        __output__ = "tuple"
+        x = props.Int
+
+    assert props.Nested(RecordModel).load({"x": 1}) == (1,)
+
+
+class Address(props.Model):
+    city = props.String()
+    code = props.String()
+
+
+class User(props.Model):
+    name = props.String()
+    age = props.Int(min_value=0)
+    address = props.Nested(Address, nullable=True)
+
+
+@pytest.fixture
+def user():
+    return props.Nested(User).load(
+        {"name": "a", "age": 1, "address": {"city": "x", "code": "1"}}
+    )
+
+
+def test_load_partial(user):
+    assert props.Nested(User).load_partial({"age": "2"}, base=user) == {
+        "name": "a",
+        "age": 2,
+        "address": {"city": "x", "code": "1"},
+    }
+    assert user["age"] == 1
+
+
+def test_load_partial_only_validates_delta(user):
+    age = props.Int()
+    age._validate = lambda value: pytest.fail("validated untouched field")
+    schema = props.Inline(props=dict(name=props.String(), age=age))
+    assert schema.load_partial({"name": "b"}, base={"name": "a", "age": 1}) == {
+        "name": "b",
+        "age": 1,
+    }
+
+
+def test_load_partial_without_base():
+    assert User.load_partial({"age": "2"}) == {"age": 2}
+
+
+def test_load_partial_merges_nested(user):
+    loaded = User.load_partial({"address": {"city": "y"}}, base=user)
+    assert loaded["address"] == {"city": "y", "code": "1"}
+
+
+def test_load_partial_replaces_null_nested():
+    base = props.Nested(User).load({"name": "a", "age": 1})
+    with pytest.raises(props.BatchValidationError):
+        User.load_partial({"address": {"city": "y"}}, base=base)
+
+
+def test_load_partial_errors(user):
+    with pytest.raises(props.BatchValidationError) as ex:
+        User.load_partial({"age": -1, "extra": 1}, base=user)
+    assert ex.value.count == 2
+
+
+def test_load_partial_null(user):
+    with pytest.raises(props.BatchValidationError):
+        User.load_partial({"name": None}, base=user)
+
+
+def test_load_partial_wrong_type():
+    with pytest.raises(props.PropertyValidationError):
+        User.load_partial([1])
+
+
+@pytest.mark.parametrize("output", ["slots", "tuple"])
+def test_load_partial_record(output):
+    schema = props.Nested(Address, output=output)
+    base = schema.load({"city": "x", "code": "1"})
+    loaded = schema.load_partial({"code": "2"}, base=base)
+    assert loaded == schema.load({"city": "x", "code": "2"})
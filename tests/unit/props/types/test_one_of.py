@@ -0,0 +1,76 @@
+import pytest
+
+from jason import props
+
+
+class Created(props.Model):
+    type = props.Choice(["created"])
+    id = props.Int()
+
+
+class Deleted(props.Model):
+    type = props.Choice(["deleted"])
+    reason = props.String()
+
+
+@pytest.fixture
+def prop():
+    return props.OneOf("type", {"created": Created, "deleted": Deleted})
+
+
+def test_validates(prop):
+    assert prop.load({"type": "created", "id": "12"}) == {"type": "created", "id": 12}
+    assert prop.load({"type": "deleted", "reason": "x"}) == {
+        "type": "deleted",
+        "reason": "x",
+    }
+
+
+def test_errors_from_variant_only(prop):
+    with pytest.raises(props.BatchValidationError) as ex:
+        prop.load({"type": "created", "reason": "x"})
+    assert [path for path, _ in ex.value.flatten()] == [("id",), ()]
+
+
+def test_unknown_discriminator(prop):
+    with pytest.raises(props.PropertyValidationError):
+        prop.load({"type": "updated"})
+
+
+def test_unhashable_discriminator(prop):
+    with pytest.raises(props.PropertyValidationError):
+        prop.load({"type": ["created"]})
+
+
+def test_missing_discriminator(prop):
+    with pytest.raises(props.PropertyValidationError):
+        prop.load({"id": 12})
+
+
+def test_nullable():
+    assert props.OneOf("type", {"created": Created}, nullable=True).load(None) is None
+
+
+def test_not_nullable(prop):
+    with pytest.raises(props.PropertyValidationError):
+        prop.load(None)
+
+
+def test_wrong_type(prop):
+    with pytest.raises(props.PropertyValidationError):
+        prop.load("created")
+
+
+def test_variant_types():
+    prop = props.OneOf(
+        "kind",
+        {
+            1: props.Inline(props=dict(kind=props.Int, x=props.Int)),
+            2: props.Nested(Created, strict=False),
+        },
+    )
+    assert prop.load({"kind": 1, "x": 2}) == {"kind": 1, "x": 2}
+    assert prop.load({"kind": 2, "type": "created", "id": 1}) == {
+        "type": "created",
+        "id": 1,
+    }
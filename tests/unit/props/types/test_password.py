@@ -98,3 +98,24 @@ def test_score():
     with pytest.raises(props.PropertyValidationError):
         assert props.Password(score=3).load("1Bc")
     assert props.Password(score=3).load("1Bc$") == "1Bc$"
+
+
+@pytest.mark.parametrize("value", ["pass word", "pass\tword", "pass　word"])
+def test_whitespace_fails(value):
+    with pytest.raises(props.PropertyValidationError):
+        props.Password().load(value)
+
+
+def test_non_ascii_is_symbol():
+    props.Password(symbols=True).load("passwörd")
+
+
+@pytest.mark.parametrize(
+    "value, score",
+    [("password", 0), ("Password", 1), ("Passw0rd", 2), ("Passw0rd!", 3)],
+)
+def test_scores(value, score):
+    props.Password(score=score).load(value)
+    if score < 3:
+        with pytest.raises(props.PropertyValidationError):
+            props.Password(score=score + 1).load(value)
@@ -1,3 +1,5 @@
+import pickle
+
 import pytest
 
 from jason import props
@@ -27,3 +29,48 @@ def test_decorator():
         return value * 2
 
     assert my_int.load(123) == 246
+
+
+def test_decorator_chain():
+    prop = props.String()(str.strip)(str.upper)
+    assert prop.validators == (str.strip, str.upper)
+    assert prop.load(" abc ") == "ABC"
+
+
+def test_decorator_runs_after_validation():
+    prop = props.Int(max_value=5)(lambda value: value * 2)
+    assert prop.load("4") == 8
+    with pytest.raises(props.PropertyValidationError):
+        prop.load(6)
+
+
+def test_decorator_not_run_on_null():
+    prop = props.Int(nullable=True)(lambda value: value * 2)
+    assert prop.load(None) is None
+
+
+def test_decorator_is_picklable():
+    prop = pickle.loads(pickle.dumps(props.String()(str.strip)))
+    assert prop.load(" a ") == "a"
+
+
+def test_identical():
+    assert props.Int(min_value=1).is_identical_to(props.Int(min_value=1))
+    assert props.String()(str.strip).is_identical_to(props.String()(str.strip))
+
+
+def test_not_identical():
+    assert not props.Int(min_value=1).is_identical_to(props.Int(min_value=2))
+    assert not props.Int().is_identical_to(props.Float())
+    assert not props.String()(str.strip).is_identical_to(props.String()(str.upper))
+    assert not props.Int(default=lambda: 1).is_identical_to(
+        props.Int(default=lambda: 1)
+    )
+
+
+def test_fingerprint():
+    assert (
+        props.Array(props.Int(max_value=2)).fingerprint()
+        == props.Array(props.Int(max_value=2)).fingerprint()
+    )
+    hash(props.Nested(props.Inline(props=dict(x=props.Int))).fingerprint())
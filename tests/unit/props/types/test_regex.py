@@ -28,3 +28,9 @@ def test_invalid_string():
 
 def test_default():
     assert props.Regex("[az]+", default="abcde").load(None) == "abcde"
+
+
+def test_matches_from_start():
+    assert props.Regex("[a-z]+").load("abc123") == "abc123"
+    with pytest.raises(props.PropertyValidationError):
+        props.Regex("[a-z]+").load("123abc")
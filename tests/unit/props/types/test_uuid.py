@@ -32,3 +32,15 @@ def test_invalid_string():
 
 def test_default():
     assert props.Uuid(default=uuid).load(None) == uuid
+
+
+@pytest.mark.parametrize(
+    "value", [uuid.upper(), uuid.replace("-", ""), f"{{{uuid}}}", f"urn:uuid:{uuid}"]
+)
+def test_other_formats(value):
+    assert props.Uuid().load(value) == value
+
+
+def test_invalid_canonical_length_string():
+    with pytest.raises(props.PropertyValidationError):
+        props.Uuid().load("g" * 8 + uuid[8:])
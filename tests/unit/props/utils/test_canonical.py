@@ -0,0 +1,29 @@
+import pytest
+
+from jason.props import record, utils
+
+
+def test_canonical_dict_ignores_order():
+    assert utils.canonical({"a": [1], "b": 2}) == utils.canonical({"b": 2, "a": [1]})
+
+
+def test_canonical_is_hashable():
+    hash(utils.canonical({"a": [{"b": {1, 2}}]}))
+
+
+def test_canonical_list_and_tuple_differ():
+    assert utils.canonical([1, 2]) != utils.canonical((1, 2))
+
+
+def test_canonical_record():
+    Slots = record.record_type("Slots", ("a", "b"), "slots")
+    assert utils.canonical(Slots(1, [2])) == utils.canonical(Slots(1, [2]))
+    assert utils.canonical(Slots(1, [2])) != utils.canonical(Slots(1, [3]))
+
+
+def test_canonical_opaque():
+    class Opaque:
+        __hash__ = None
+
+    with pytest.raises(TypeError):
+        utils.canonical(Opaque())
@@ -0,0 +1,34 @@
+from jason import props
+from jason.props import utils
+
+
+def test_equivalent_instance():
+    assert utils.equivalent(props.Int(min_value=1), props.Int(min_value=1))
+
+
+def test_equivalent_modified_instance():
+    mod_prop = props.Int(min_value=1, max_value=2)
+    mod_prop.range.thing = False
+    assert not utils.equivalent(props.Int(min_value=1, max_value=2), mod_prop)
+
+
+def test_equivalent_functions_by_identity():
+    assert utils.equivalent([len], [len])
+    assert not utils.equivalent([lambda: 1], [lambda: 1])
+
+
+def test_equivalent_cycle():
+    a, b = [], []
+    a.append(a)
+    b.append(b)
+    assert utils.equivalent(a, b)
+
+
+def test_equivalent_matches_fingerprint():
+    for a, b in (
+        (props.Array(props.Int), props.Array(props.Int)),
+        (props.Array(props.Int), props.Array(props.Float)),
+        (props.String()(str.strip), props.String()(str.strip)),
+        (props.String()(str.strip), props.String()(str.upper)),
+    ):
+        assert utils.equivalent(a, b) == (utils.fingerprint(a) == utils.fingerprint(b))
@@ -0,0 +1,26 @@
+from jason import props
+from jason.props import utils
+
+
+def test_fingerprint_instance():
+    assert utils.fingerprint(props.Int(min_value=1, max_value=2)) == utils.fingerprint(
+        props.Int(min_value=1, max_value=2)
+    )
+
+
+def test_fingerprint_modified_instance():
+    mod_prop = props.Int(min_value=1, max_value=2)
+    mod_prop.range.thing = False
+    assert utils.fingerprint(props.Int(min_value=1, max_value=2)) != utils.fingerprint(
+        mod_prop
+    )
+
+
+def test_fingerprint_is_hashable():
+    hash(utils.fingerprint(props.Choice(["a", "b"])))
+
+
+def test_fingerprint_cycle():
+    prop = props.Int()
+    prop.parent = prop
+    assert utils.fingerprint(prop)
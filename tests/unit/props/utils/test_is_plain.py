@@ -0,0 +1,18 @@
+from jason import props
+from jason.props import utils
+
+
+def test_is_plain():
+    assert utils.is_plain(props.Int(), (props.Int,)) is True
+
+
+def test_is_not_plain_subclass():
+    assert utils.is_plain(props.Int(), (props.Number,)) is False
+
+
+def test_is_not_plain_decorated():
+    @props.Int()
+    def prop(value):
+        return value
+
+    assert utils.is_plain(prop, (props.Int,)) is False
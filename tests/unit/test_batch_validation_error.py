@@ -1,3 +1,5 @@
+import pickle
+
 from jason.error import BatchValidationError
 
 
@@ -30,3 +32,43 @@ something else went wrong
         - another thing
         - and another thing"""
     )
+
+
+def test_path_error():
+    nested = BatchValidationError("failed to validate object", (("x", "bad x"),))
+    err = BatchValidationError("failed to validate array", ((0, "bad"), (1, nested)))
+    assert (
+        str(err)
+        == """failed to validate batch (2 errors):
+failed to validate array
+    - [0]: bad
+    - [1]: failed to validate object
+        - x: bad x"""
+    )
+
+
+def test_renders_lazily():
+    err = BatchValidationError("something went wrong", ("a thing",))
+    assert err._lines is None
+    assert err.message == "something went wrong\n    - a thing"
+    assert err._lines is not None
+
+
+def test_flatten():
+    nested = BatchValidationError("failed", (("x", "bad x"), "no path"))
+    err = BatchValidationError("failed", ((0, "bad"), (1, nested)))
+    assert err.flatten() == [((0,), "bad"), ((1, "x"), "bad x"), ((1,), "no path")]
+
+
+def test_pickle():
+    nested = BatchValidationError("failed", (("x", "bad x"),))
+    err = pickle.loads(pickle.dumps(BatchValidationError("failed", [(1, nested)])))
+    assert err.count == 1
+    assert err.flatten() == [((1, "x"), "bad x")]
+
+
+def test_truncated():
+    nested = BatchValidationError("something went wrong", ("a thing",), truncated=True)
+    err = BatchValidationError("something else went wrong", ("a thing", nested))
+    assert err.truncated
+    assert err.lines[-1] == "    - validation stopped after 2 errors"
@@ -0,0 +1,172 @@
+import base64
+import json
+import os
+from unittest import mock
+
+import jwt
+import pytest
+
+from jason.token import Handler, KeyRing
+
+
+def jwk(kid, secret, alg="HS256"):
+    k = base64.urlsafe_b64encode(secret.encode()).decode().rstrip("=")
+    return {"kid": kid, "kty": "oct", "k": k, "alg": alg}
+
+
+def write(path, *keys, mtime=None):
+    path.write_text(json.dumps({"keys": list(keys)}))
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = tmp_path / "jwks.json"
+    write(path, jwk("a", "secret-a"), jwk("b", "secret-b"), mtime=1000)
+    return path
+
+
+def load_token(handler, token):
+    with mock.patch("jason.token.handler.flask") as mock_flask:
+        mock_flask.g = {}
+        mock_flask.request.headers.get.return_value = token
+        handler.before_request()
+        return mock_flask.g["_ACCESS_TOKEN"]
+
+
+def test_loads_keys(path):
+    ring = KeyRing(str(path))
+    assert ring.get("a") == ("HS256", b"secret-a")
+    assert set(ring.keys) == {"a", "b"}
+
+
+def test_unknown_kid(path):
+    with pytest.raises(jwt.InvalidTokenError):
+        KeyRing(str(path)).get("c")
+
+
+def test_default_algorithm(tmp_path):
+    path = tmp_path / "jwks.json"
+    key = jwk("a", "secret")
+    del key["alg"]
+    write(path, key)
+    with pytest.raises(ValueError):
+        KeyRing(str(path))
+    assert KeyRing(str(path), algorithm="HS512").get("a")[0] == "HS512"
+
+
+def test_invalid_key(tmp_path):
+    path = tmp_path / "jwks.json"
+    write(path, {"kid": "a", "kty": "RSA", "alg": "HS256"})
+    with pytest.raises(ValueError):
+        KeyRing(str(path))
+
+
+def test_refresh(path):
+    ring = KeyRing(str(path))
+    assert ring.refresh() is False
+    write(path, jwk("c", "secret-c"), mtime=2000)
+    assert ring.refresh() is True
+    assert set(ring.keys) == {"c"}
+
+
+def test_refresh_keeps_keys_on_error(path):
+    ring = KeyRing(str(path))
+    path.write_text("{nope")
+    os.utime(path, (2000, 2000))
+    assert ring.refresh() is False
+    assert ring.error is not None
+    assert set(ring.keys) == {"a", "b"}
+
+
+def test_notifies_removed_keys(path):
+    ring = KeyRing(str(path))
+    listener = mock.Mock()
+    ring.listeners.append(listener)
+    write(path, jwk("a", "secret-a"), jwk("c", "secret-c"), mtime=2000)
+    ring.refresh()
+    listener.assert_called_once_with(frozenset({"b"}))
+
+
+def test_notifies_replaced_keys(path):
+    ring = KeyRing(str(path))
+    listener = mock.Mock()
+    ring.listeners.append(listener)
+    write(path, jwk("a", "rotated-a"), jwk("b", "secret-b"), mtime=2000)
+    assert ring.refresh() is True
+    listener.assert_called_once_with(frozenset({"a"}))
+    assert ring.get("a") == ("HS256", b"rotated-a")
+
+
+def test_rejects_none_algorithm(path):
+    ring = KeyRing(str(path))
+    write(path, jwk("a", "secret-a", alg="none"), mtime=2000)
+    assert ring.refresh() is False
+    assert isinstance(ring.error, ValueError)
+    assert set(ring.keys) == {"a", "b"}
+
+
+@pytest.mark.parametrize("content", ["[]", '{"keys": [1]}'])
+def test_refresh_keeps_keys_on_malformed_file(path, content):
+    ring = KeyRing(str(path))
+    path.write_text(content)
+    os.utime(path, (2000, 2000))
+    assert ring.refresh() is False
+    assert ring.error is not None
+    assert set(ring.keys) == {"a", "b"}
+
+
+def test_watch(path):
+    ring = KeyRing(str(path), interval=0.01)
+    ring.start()
+    try:
+        write(path, jwk("c", "secret-c"), mtime=2000)
+        for _ in range(500):
+            if "c" in ring.keys:
+                break
+            ring.stopped.wait(0.01)
+    finally:
+        ring.stop()
+    assert set(ring.keys) == {"c"}
+
+
+def test_handler_signs_and_verifies_by_kid(path):
+    signer = Handler(lifespan=10, key_ring=KeyRing(str(path), signing_kid="b"))
+    verifier = Handler(lifespan=10, key_ring=KeyRing(str(path)))
+    token = signer.generate_token(user_id="x")
+    assert jwt.get_unverified_header(token)["kid"] == "b"
+    assert load_token(verifier, token)["uid"] == "x"
+
+
+def test_handler_rejects_removed_key(path):
+    ring = KeyRing(str(path), signing_kid="b")
+    handler = Handler(lifespan=10, key_ring=ring, cache_size=10)
+    token = handler.generate_token()
+    load_token(handler, token)
+    assert handler.cache.info().size == 1
+    write(path, jwk("a", "secret-a"), mtime=2000)
+    ring.refresh()
+    assert handler.cache.info().size == 0
+    with pytest.raises(jwt.InvalidTokenError):
+        load_token(handler, token)
+
+
+def test_handler_rejects_replaced_key(path):
+    ring = KeyRing(str(path), signing_kid="b")
+    handler = Handler(lifespan=10, key_ring=ring, cache_size=10)
+    token = handler.generate_token()
+    load_token(handler, token)
+    write(path, jwk("a", "secret-a"), jwk("b", "rotated-b"), mtime=2000)
+    ring.refresh()
+    assert handler.cache.info().size == 0
+    with pytest.raises(jwt.InvalidTokenError):
+        load_token(handler, token)
+
+
+def test_handler_falls_back_to_key_without_kid(path):
+    handler = Handler(
+        lifespan=10, key="static", algorithm="HS256", key_ring=KeyRing(str(path))
+    )
+    token = jwt.encode({"uid": "x", "exp": 9999999999}, "static", algorithm="HS256")
+    assert load_token(handler, token)["uid"] == "x"
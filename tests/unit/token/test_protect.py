@@ -40,3 +40,17 @@ def test_fails_to_validate(prop, err):
 
     with pytest.raises(Unauthorized):
         protected()
+
+
+def test_resolves_lazy_token(prop):
+    handler = mock.Mock()
+    handler.load_token.return_value = {"uid": "a"}
+    lazy = token.LazyToken(handler, "raw-token")
+
+    @token.protect(prop)
+    def protected():
+        return True
+
+    with mock.patch("flask.g", {"_ACCESS_TOKEN": lazy}):
+        assert protected() is True
+    prop.validate.assert_called_once_with({"uid": "a"})
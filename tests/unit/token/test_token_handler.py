@@ -1,9 +1,11 @@
+import time
 from unittest import mock
 
 import flask
 import pytest
+from jwt.algorithms import HMACAlgorithm
 
-from jason.token import Handler
+from jason.token import Handler, current_token
 
 PARAMETERISED_CONFIG_KEYS = [
     "key",
@@ -170,3 +172,221 @@ def test_auto_update():
         mock_flask.g = {"_ACCESS_TOKEN": {}}
         response = handler.after_request(response)
     assert "Authorization" in response.headers
+
+
+def load_token(handler, token):
+    with mock.patch("jason.token.handler.flask") as mock_flask:
+        mock_flask.g = {}
+        mock_flask.request.headers.get.return_value = token
+        handler.before_request()
+        return mock_flask.g["_ACCESS_TOKEN"]
+
+
+def test_cache_skips_decoding():
+    handler = Handler(
+        lifespan=10,
+        key="something",
+        algorithm="HS256",
+        encryption_key="something",
+        cache_size=10,
+    )
+    token = handler.generate_token(user_id="a")
+    assert load_token(handler, token)["uid"] == "a"
+    with mock.patch.object(handler, "_decode") as decode:
+        assert load_token(handler, token)["uid"] == "a"
+        decode.assert_not_called()
+    assert handler.cache.info()[:2] == (1, 1)
+
+
+def test_cache_returns_copies():
+    handler = Handler(lifespan=10, key="something", algorithm="HS256", cache_size=10)
+    token = handler.generate_token()
+    load_token(handler, token)["exp"] = 0
+    assert load_token(handler, token)["exp"] > 0
+
+
+def test_cache_expires_with_token():
+    handler = Handler(lifespan=10, key="something", algorithm="HS256", cache_size=10)
+    token = handler.generate_token()
+    load_token(handler, token)
+    with mock.patch("jason.token.cache.time.time", return_value=time.time() + 20):
+        assert handler.cache.get(token) is None
+    assert handler.cache.info().expired == 1
+
+
+def test_cache_ttl():
+    handler = Handler(
+        lifespan=100, key="something", algorithm="HS256", cache_size=10, cache_ttl=1
+    )
+    token = handler.generate_token()
+    load_token(handler, token)
+    with mock.patch("jason.token.cache.time.time", return_value=time.time() + 2):
+        assert handler.cache.get(token) is None
+
+
+def test_cache_cleared_on_configure():
+    handler = Handler(lifespan=10, key="something", algorithm="HS256", cache_size=10)
+    load_token(handler, handler.generate_token())
+    handler.configure(key="other")
+    assert handler.cache.info().size == 0
+
+
+def test_cache_evicts():
+    handler = Handler(lifespan=10, key="something", algorithm="HS256", cache_size=1)
+    load_token(handler, handler.generate_token(user_id="a"))
+    load_token(handler, handler.generate_token(user_id="b"))
+    assert handler.cache.info().evictions == 1
+    assert handler.cache.info().size == 1
+
+
+def test_cache_does_not_store_invalid_tokens():
+    handler = Handler(lifespan=10, key="something", algorithm="HS256", cache_size=10)
+    with pytest.raises(Exception):
+        load_token(handler, "nope")
+    assert handler.cache.info().size == 0
+
+
+def test_lazy_defers_decoding():
+    handler = Handler(lifespan=10, key="something", algorithm="HS256", lazy=True)
+    token = handler.generate_token(user_id="a")
+    with mock.patch.object(handler, "_decode", wraps=handler._decode) as decode:
+        lazy = load_token(handler, token)
+        decode.assert_not_called()
+        assert not lazy.loaded
+        assert lazy["uid"] == "a"
+        assert lazy.get("uid") == "a"
+        decode.assert_called_once()
+
+
+def test_lazy_invalid_token_raises_on_access():
+    handler = Handler(lifespan=10, key="something", algorithm="HS256", lazy=True)
+    lazy = load_token(handler, "nope")
+    with pytest.raises(Exception):
+        lazy["uid"]
+
+
+def test_lazy_auto_update():
+    handler = Handler(
+        lifespan=10, key="something", algorithm="HS256", lazy=True, auto_update=True
+    )
+    token = handler.generate_token()
+    lazy = load_token(handler, token)
+    with mock.patch("jason.token.handler.flask") as mock_flask:
+        mock_flask.g = {"_ACCESS_TOKEN": lazy}
+        response = handler.after_request(flask.Response())
+    assert "Authorization" in response.headers
+
+
+def test_current_token():
+    handler = Handler(lifespan=10, key="something", algorithm="HS256", lazy=True)
+    lazy = load_token(handler, handler.generate_token(user_id="a"))
+    with mock.patch("jason.token.lazy.flask") as mock_flask:
+        mock_flask.g = {"_ACCESS_TOKEN": lazy}
+        assert current_token()["uid"] == "a"
+        mock_flask.g = {}
+        assert current_token() is None
+
+
+def refresh(handler, token_data, raw="raw-token"):
+    with mock.patch("jason.token.handler.flask") as mock_flask:
+        mock_flask.g = {"_ACCESS_TOKEN": token_data, "_RAW_ACCESS_TOKEN": raw}
+        with mock.patch.object(handler, "_encode", return_value="new-token") as encode:
+            response = handler.after_request(flask.Response())
+    return response.headers.get("Authorization"), encode.called
+
+
+def test_refresh_window():
+    handler = Handler(
+        lifespan=100, key="something", auto_update=True, refresh_window=30
+    )
+    assert refresh(handler, {"exp": time.time() + 90}) == ("raw-token", False)
+    assert refresh(handler, {"exp": time.time() + 10}) == ("new-token", True)
+
+
+def test_refresh_ratio():
+    handler = Handler(
+        lifespan=100, key="something", auto_update=True, refresh_ratio=0.5
+    )
+    assert refresh(handler, {"exp": time.time() + 60}) == ("raw-token", False)
+    assert refresh(handler, {"exp": time.time() + 40}) == ("new-token", True)
+
+
+def test_refresh_without_policy():
+    handler = Handler(lifespan=100, key="something", auto_update=True)
+    assert refresh(handler, {"exp": time.time() + 90}) == ("new-token", True)
+
+
+def test_refresh_without_exp():
+    handler = Handler(
+        lifespan=100, key="something", auto_update=True, refresh_window=30
+    )
+    assert refresh(handler, {}) == ("new-token", True)
+
+
+def test_stores_raw_token_in_g():
+    handler = Handler(lifespan=10, key="something", algorithm="HS256")
+    token = handler.generate_token()
+    with mock.patch("jason.token.handler.flask") as mock_flask:
+        mock_flask.g = {}
+        mock_flask.request.headers.get.return_value = token
+        handler.before_request()
+        assert mock_flask.g["_RAW_ACCESS_TOKEN"] == token
+
+
+def test_decoder_options_are_per_instance():
+    handler = Handler(verify_exp=False)
+    assert handler.verify_exp is False
+    assert Handler().verify_exp is True
+    assert Handler.DECODER_OPTIONS["verify_exp"] is True
+
+
+def test_prepares_keys_once():
+    handler = Handler(lifespan=10, key="something", algorithm="HS256")
+    token = handler.generate_token()
+    assert handler.encode_key == b"something"
+    prepare_key = HMACAlgorithm.prepare_key
+    with mock.patch.object(
+        HMACAlgorithm, "prepare_key", autospec=True, side_effect=prepare_key
+    ) as patched:
+        load_token(handler, token)
+        handler.generate_token()
+    assert patched.called
+    assert all(isinstance(call.args[1], bytes) for call in patched.call_args_list)
+
+
+def test_separate_keys():
+    signer = Handler(lifespan=10, signing_key="something", algorithm="HS256")
+    verifier = Handler(lifespan=10, verification_key="something", algorithm="HS256")
+    assert verifier.encode_key is None
+    assert load_token(verifier, signer.generate_token(user_id="a"))["uid"] == "a"
+    with pytest.raises(ValueError):
+        verifier.generate_token()
+
+
+def test_verification_key_is_enough():
+    handler = Handler(lifespan=10, verification_key="something")
+    handler.before_first_request()
+
+
+def test_unsupported_algorithm():
+    with pytest.raises(ValueError):
+        Handler(key="something", algorithm="nope")
+
+
+def test_asymmetric_keys():
+    serialization = pytest.importorskip("cryptography.hazmat.primitives.serialization")
+    ec = pytest.importorskip("cryptography.hazmat.primitives.asymmetric.ec")
+    private_key = ec.generate_private_key(ec.SECP256R1())
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    signer = Handler(lifespan=10, key=private_pem, algorithm="ES256")
+    verifier = Handler(lifespan=10, verification_key=public_pem, algorithm="ES256")
+    token = signer.generate_token(user_id="a")
+    assert load_token(signer, token)["uid"] == "a"
+    assert load_token(verifier, token)["uid"] == "a"
@@ -126,3 +126,13 @@ def test_encode_obj_all():
 def test_encode_dict():
     obj = {"x": 12, "y": "thing"}
     assert JSONEncoder.encode(obj) == '{"x": 12, "y": "thing"}'
+
+
+@pytest.mark.parametrize(
+    "output, expected", [("slots", '{"x": 1, "y": "a"}'), ("tuple", '[1, "a"]')]
+)
+def test_encodes_record(output, expected):
+    from jason.props import record
+
+    thing = record.record_type("Thing", ("x", "y"), output)(1, "a")
+    assert JSONEncoder().encode(thing) == expected
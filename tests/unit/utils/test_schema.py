@@ -1,16 +1,36 @@
+import datetime
+import io
+import json as json_lib
 from contextlib import contextmanager
 from unittest import mock
 
 import pytest
 
 from jason import props, request_schema
-from jason.exception import BadRequest
+from jason.exception import BadRequest, RequestEntityTooLarge
 from jason.utils import request_schema as request_schema_module
 
 
-def mock_request(args=None, query=None, json=None, form=None):
+def mock_request(
+    args=None,
+    query=None,
+    json=None,
+    form=None,
+    stream=None,
+    data=None,
+    content_length=None,
+):
+    if data is None and json is not None:
+        data = json_lib.dumps(json).encode()
     return mock.Mock(
-        view_args=args, args=query, json=json, form=form, is_json=json is not None
+        content_length=content_length,
+        view_args=args,
+        args=query,
+        json=json,
+        form=form,
+        stream=stream,
+        get_data=mock.Mock(return_value=data),
+        is_json=data is not None or stream is not None,
     )
 
 
@@ -207,3 +227,131 @@ def test_kwargs_override_model(model):
     assert thing_id == 123
     assert other_id == 456
     assert parsed_json == {"age": 30}
+
+
+def test_compiled(model):
+    @request_schema(model=model, compiled=True)
+    def mock_route(thing_id, other_id, json):
+        return thing_id, other_id, json
+
+    with patch_request(json=dict(name="hello"), args=dict(thing_id=123, other_id=456)):
+        thing_id, other_id, parsed_json = mock_route()
+
+    assert thing_id == 123
+    assert other_id == 456
+    assert parsed_json == {"name": "hello"}
+
+    with patch_request(json=dict(name=1), args=dict(thing_id=1, other_id=2)):
+        with pytest.raises(BadRequest):
+            mock_route()
+
+
+def test_compiled_decodes_body():
+    @request_schema(
+        json=props.Inline(props=dict(when=props.Datetime(), day=props.Date())),
+        compiled=True,
+    )
+    def mock_route(json):
+        return json
+
+    data = b'{"when": "2019-01-01T00:00:00Z", "day": "2019-01-02"}'
+    with patch_request(data=data):
+        assert mock_route() == {
+            "when": datetime.datetime(2019, 1, 1, tzinfo=datetime.timezone.utc),
+            "day": datetime.date(2019, 1, 2),
+        }
+
+    with patch_request(data=b'{"when": '):
+        with pytest.raises(BadRequest):
+            mock_route()
+
+
+def test_stream():
+    @request_schema(json=props.Array(props.Int), stream=True)
+    def mock_route(json):
+        return list(json)
+
+    with patch_request(stream=io.BytesIO(b"[1, 2, 3]")):
+        assert mock_route() == [1, 2, 3]
+
+    with patch_request(stream=io.BytesIO(b'[1, "a", 3]')):
+        with pytest.raises(BadRequest):
+            mock_route()
+
+    with patch_request(stream=io.BytesIO(b"[1, 2")):
+        with pytest.raises(BadRequest):
+            mock_route()
+
+
+def test_stream_requires_array():
+    with pytest.raises(ValueError):
+        request_schema(json=props.Int(), stream=True)
+
+
+def test_limits():
+    @request_schema(
+        json=props.Inline(props=dict(tags=props.Array(props.String, max_length=2))),
+        limits=True,
+    )
+    def mock_route(json):
+        return json
+
+    with patch_request(json=dict(tags=["a", "b"])):
+        assert mock_route() == {"tags": ["a", "b"]}
+
+    with patch_request(json=dict(tags=["a"] * 100)):
+        with pytest.raises(BadRequest) as ex:
+            mock_route()
+    assert "array longer than 2" in ex.value.description
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+def test_explicit_limits(compiled):
+    @request_schema(
+        json=props.Inline(props=dict(x=props.Property(nullable=True))),
+        limits=props.Limits(max_depth=3),
+        compiled=compiled,
+    )
+    def mock_route(json):
+        return json
+
+    with patch_request(json=dict(x=[[1]])):
+        assert mock_route() == {"x": [[1]]}
+
+    with patch_request(json=dict(x=[[[1]]])):
+        with pytest.raises(BadRequest):
+            mock_route()
+
+
+def test_stream_limits():
+    @request_schema(
+        json=props.Array(props.String(max_length=3)), stream=True, limits=True
+    )
+    def mock_route(json):
+        return list(json)
+
+    with patch_request(stream=io.BytesIO(b'["a", "abcdef"]')):
+        with pytest.raises(BadRequest):
+            mock_route()
+
+
+def test_limits_require_schema():
+    with pytest.raises(ValueError):
+        request_schema(json=True, limits=True)
+
+
+def test_max_body_size():
+    @request_schema(json=True, max_body_size=10)
+    def mock_route(json):
+        return json
+
+    with patch_request(json=[1], content_length=3):
+        assert mock_route() == [1]
+
+    with patch_request(json=[1], content_length=100):
+        with pytest.raises(RequestEntityTooLarge):
+            mock_route()
+
+    with patch_request(data=b"[" + b"1, " * 10 + b"1]"):
+        with pytest.raises(RequestEntityTooLarge):
+            mock_route()
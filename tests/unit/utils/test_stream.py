@@ -0,0 +1,37 @@
+import io
+import json
+
+import pytest
+
+from jason.utils.stream import iter_json_array
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1024])
+@pytest.mark.parametrize(
+    "value",
+    [
+        [],
+        [1, 2, 3],
+        [{"a": [1, 2, {"b": "x,]"}]}, "héllo ☃", 12345678901234567890],
+        [1.5e10, True, None, False, '\\"q'],
+    ],
+)
+def test_iterates_array(value, chunk_size):
+    raw = json.dumps(value, ensure_ascii=False).encode()
+    assert list(iter_json_array(io.BytesIO(raw), chunk_size=chunk_size)) == value
+
+
+def test_is_lazy():
+    items = iter_json_array(io.BytesIO(b"[1, 2, nope]"), chunk_size=1)
+    assert next(items) == 1
+    assert next(items) == 2
+    with pytest.raises(json.JSONDecodeError):
+        next(items)
+
+
+@pytest.mark.parametrize(
+    "raw", [b"", b"{}", b"[1,", b"[1 2]", b"[1]x", b"[tru]", b"[1,]"]
+)
+def test_invalid(raw):
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array(io.BytesIO(raw), chunk_size=2))